@@ -7,22 +7,102 @@ Handles profile.nc, meta.nc, and trajectory.nc files with complete database popu
 import numpy as np
 import xarray as xr
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2 import pool
+from psycopg2.extras import execute_values, Json
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from contextlib import contextmanager
 import pandas as pd
 # from datetime import datetime
 from datetime import datetime, timedelta
+import itertools
 import json
 import logging
 import os
+import re
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Batch size for execute_values pages; ~1000 is the PostgreSQL sweet spot
+# but stays overridable for tuning without a code change
+EXECUTE_VALUES_PAGE_SIZE = int(os.getenv('EXECUTE_VALUES_PAGE_SIZE', '1000'))
+
+# Worker threads for parallel measurement COPY; Postgres runs each COPY
+# single-threaded per connection, so disjoint chunks on separate pooled
+# connections load concurrently
+MEASUREMENT_COPY_WORKERS = int(os.getenv('MEASUREMENT_COPY_WORKERS', '4'))
+MEASUREMENT_COPY_CHUNK = int(os.getenv('MEASUREMENT_COPY_CHUNK', '10000'))
+
+# 256-entry lookup of valid QC flag characters (digits and A-F, either case)
+# so safe_qc_decode validates with one index instead of isdigit()/in checks
+_VALID_QC_TABLE = bytearray(256)
+_VALID_QC_TABLE[ord('0'):ord('9') + 1] = b'\x01' * 10
+_VALID_QC_TABLE[ord('A'):ord('F') + 1] = b'\x01' * 6
+_VALID_QC_TABLE[ord('a'):ord('f') + 1] = b'\x01' * 6
+
+# Array form of the same flags for vectorized QC validation
+_VALID_QC_CHARS = np.array(list('0123456789ABCDEFabcdef'))
+
+def _parse_battery_packs(text):
+    """Extract the pack count from battery text like "board -  1 (s/n: 41);"
+
+    A number following a dash wins (the usual DAC layout); otherwise the
+    first number anywhere in the text is used. Plain string scanning -
+    cheaper than the regex pair it replaces.
+    """
+    first_number = None
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch == '-':
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            k = j
+            while k < n and text[k].isdigit():
+                k += 1
+            if k > j:
+                return int(text[j:k])
+            i = j if j > i + 1 else i + 1
+        elif ch.isdigit():
+            k = i + 1
+            while k < n and text[k].isdigit():
+                k += 1
+            if first_number is None:
+                first_number = int(text[i:k])
+            i = k
+        else:
+            i += 1
+    return first_number
+
+
+def _safe_char_1(value):
+    """Ensure value fits in CHAR(1)"""
+    if value is None:
+        return None
+    str_val = str(value).strip()
+    if str_val.lower() == 'nan':
+        return None
+    return str_val[:1] if str_val else None
+
+
+def _safe_varchar_50(value):
+    """Ensure value fits in VARCHAR(50)"""
+    if value is None:
+        return None
+    str_val = str(value).strip()
+    return str_val[:50] if str_val else None
+
+
 class UltimateArgoNetCDFParser:
     def __init__(self, postgres_config="database.ini"):
         self.postgres_config = postgres_config
         self.connection = None
+        self._pool = None
+        self._in_transaction = False
+        self._history_constraint_checked = False
+        self._prepared = set()
 
     def load_postgres_config(self):
         """Load PostgreSQL configuration"""
@@ -36,19 +116,103 @@ class UltimateArgoNetCDFParser:
                 config[param[0]] = param[1]
         return config
 
-    def connect_postgres(self):
-        """Connect to PostgreSQL database"""
-        if not self.connection or self.connection.closed:
+    def _get_pool(self):
+        """Lazily create the connection pool on first use"""
+        if self._pool is None:
             config = self.load_postgres_config()
-            self.connection = psycopg2.connect(
+            self._pool = pool.ThreadedConnectionPool(
+                1, 8,
                 host=config['host'],
                 port=int(config['port']),
                 user=config['user'],
                 password=config['password'],
                 database=config['database']
             )
+        return self._pool
+
+    def _tune_session(self, conn):
+        """Apply bulk-load settings to a freshly drawn connection
+
+        synchronous_commit=off skips the WAL fsync wait on commit; a crash
+        can lose the last batch, but every table merges through ON
+        CONFLICT keys so re-running the file restores it. The memory
+        bumps help the staged COPY merges and upsert sorts.
+        """
+        with conn.cursor() as cursor:
+            cursor.execute("SET synchronous_commit = off")
+            cursor.execute("SET work_mem = '64MB'")
+            cursor.execute("SET maintenance_work_mem = '256MB'")
+        conn.commit()
+
+    def connect_postgres(self):
+        """Return the cached connection, drawing from the pool if needed"""
+        if not self.connection or self.connection.closed:
+            self.connection = self._get_pool().getconn()
+            # Prepared statements live in the session; a fresh connection
+            # starts with none
+            self._prepared.clear()
+            self._tune_session(self.connection)
         return self.connection
 
+    @contextmanager
+    def pooled_connection(self):
+        """Check a dedicated connection out of the pool (e.g. for workers)"""
+        conn = self._get_pool().getconn()
+        self._tune_session(conn)
+        try:
+            yield conn
+        finally:
+            self._get_pool().putconn(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Run a group of insert_* calls under a single commit
+
+        Each insert helper normally commits (and fsyncs WAL) on its own;
+        for per-file ingest that means eight fsyncs where one would do.
+        While this context is active the helpers skip their per-call
+        commits via _commit, and the whole batch commits - or rolls back -
+        here.
+        """
+        conn = self.connect_postgres()
+        self._in_transaction = True
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # Rollback also undoes any PREPARE issued inside the
+            # transaction, so forget those names
+            self._prepared.clear()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def _commit(self, conn):
+        """Commit unless a surrounding transaction() owns the commit"""
+        if not self._in_transaction:
+            conn.commit()
+
+    def _prepare_once(self, cursor, name, sql):
+        """PREPARE a statement once per session so Postgres plans it once
+
+        Repeated EXECUTEs of the same statement skip the parse/plan step
+        that cursor.execute pays for every call.
+        """
+        if name not in self._prepared:
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            self._prepared.add(name)
+
+    def release_postgres(self, conn):
+        """Return a connection obtained from connect_postgres to the pool
+
+        The shared cached connection stays checked out for the life of the
+        parser; anything else goes back to the pool for reuse.
+        """
+        if conn is self.connection:
+            return
+        self._get_pool().putconn(conn)
+
     def safe_decode(self, value):
         """Enhanced safe decode with proper bytes handling and QC field support"""
         if value is None:
@@ -78,7 +242,7 @@ class UltimateArgoNetCDFParser:
             return decoded
             
         except Exception as e:
-            logger.warning(f"Error in safe_decode for value {repr(value)}: {e}")
+            logger.warning("Error in safe_decode for value %r: %s", value, e)
             return ''
 
 
@@ -106,6 +270,16 @@ class UltimateArgoNetCDFParser:
     def safe_int(self, value):
         """Safely convert to integer"""
         try:
+            if value is None:
+                return None
+            # Fast path: cycle/config numbers are already integer-typed in the
+            # NetCDF file, so skip the float round-trip and NaN/Inf checks
+            if isinstance(value, (int, np.integer)):
+                return int(value)
+            if isinstance(value, np.ndarray) and value.size == 1:
+                item = value.item()
+                if isinstance(item, (int, np.integer)):
+                    return int(item)
             float_val = self.safe_float(value)
             if float_val is None:
                 return None
@@ -123,6 +297,17 @@ class UltimateArgoNetCDFParser:
             return None
         except:
             return None
+    def bulk_argo_dates_to_datetime(self, col):
+        """Vectorized argo_date_to_datetime over a decoded date column
+
+        One pd.to_datetime pass with the fixed YYYYMMDDHHMMSS format
+        replaces a strptime call per row; unparseable entries become
+        None like the scalar helper.
+        """
+        strings = np.asarray(col).astype('U14')
+        parsed = pd.to_datetime(pd.Series(strings), format='%Y%m%d%H%M%S', errors='coerce')
+        return list(parsed.astype(object).where(parsed.notna(), None))
+
     def clean_timestamp_value(self, timestamp_value):
         """Clean timestamp values before database insertion"""
         if timestamp_value is None:
@@ -138,7 +323,6 @@ class UltimateArgoNetCDFParser:
         
         # Handle pandas NaT
         try:
-            import pandas as pd
             if pd.isna(timestamp_value):
                 return None
         except:
@@ -149,10 +333,6 @@ class UltimateArgoNetCDFParser:
     
     def enhanced_julian_to_datetime(self, julian_date):
         """Convert Julian date to datetime with better error handling"""
-        import numpy as np
-        from datetime import datetime
-        import pandas as pd
-
         if julian_date is None:
             return None
 
@@ -165,14 +345,14 @@ class UltimateArgoNetCDFParser:
                 # Check if it's a status code (like '2', '4') instead of Julian date
                 if decoded_val.isdigit() and len(decoded_val) <= 2:
                     # Change to DEBUG to reduce spam
-                    logger.debug(f"Skipping status code as Julian date: {decoded_val}")
+                    logger.debug("Skipping status code as Julian date: %s", decoded_val)
                     return None
                     
                 # Try to convert to float
                 try:
                     julian_date = float(decoded_val)
                 except ValueError:
-                    logger.debug(f"Cannot convert decoded value to float: {decoded_val}")
+                    logger.debug("Cannot convert decoded value to float: %s", decoded_val)
                     return None
             
             # Handle string inputs
@@ -181,7 +361,7 @@ class UltimateArgoNetCDFParser:
                     return None
                 # Check if it's a status code
                 if julian_date.isdigit() and len(julian_date) <= 2:
-                    logger.debug(f"Skipping status code as Julian date: {julian_date}")
+                    logger.debug("Skipping status code as Julian date: %s", julian_date)
                     return None
                 
                 # Check if it's already a datetime string
@@ -215,20 +395,97 @@ class UltimateArgoNetCDFParser:
             # Handle actual Julian dates (numeric values)
             if isinstance(julian_date, (int, float)):
                 if 10000 <= julian_date <= 50000:  # Days since 1950-01-01
-                    from datetime import timedelta
                     reference_date = datetime(1950, 1, 1)
                     return reference_date + timedelta(days=float(julian_date))
                 else:
-                    logger.debug(f"Julian date outside expected range: {julian_date}")
+                    logger.debug("Julian date outside expected range: %s", julian_date)
                     return None
             
             # Try to convert whatever it is to datetime
             return pd.to_datetime(julian_date).to_pydatetime()
                 
         except Exception as e:
-            logger.debug(f"Failed to convert Julian date {julian_date}: {e}")
+            logger.debug("Failed to convert Julian date %s: %s", julian_date, e)
             return None
 
+    def _bulk_safe_float(self, arr):
+        """Vectorized safe_float over a whole array
+
+        One astype/isfinite pass plus a single .tolist() replaces a
+        safe_float call per cell in the measurement loop. Returns nested
+        Python lists with None for NaN/Inf, or None if the array is not
+        numeric (caller falls back to the scalar path).
+        """
+        try:
+            floats = np.asarray(arr, dtype='float64')
+        except (TypeError, ValueError):
+            return None
+        cleaned = floats.astype(object)
+        cleaned[~np.isfinite(floats)] = None
+        return cleaned.tolist()
+
+    def _decode_col(self, arr):
+        """Vectorized safe_decode for a character column
+
+        One np.char.decode/strip pass replaces a safe_decode call per
+        row. Returns None for non-string dtypes so callers keep the
+        scalar path for numeric columns.
+        """
+        if arr is None:
+            return None
+        a = np.asarray(arr)
+        if a.dtype.kind == 'S':
+            return np.char.strip(np.char.decode(a, 'utf-8', 'ignore'))
+        if a.dtype.kind == 'U':
+            return np.char.strip(a)
+        return None
+
+    def _bulk_qc_decode(self, arr):
+        """Vectorized safe_qc_decode over a whole QC char array
+
+        Decodes and validates every flag in a few NumPy passes; invalid
+        flags become '0' like the scalar helper. Returns nested Python
+        lists, or None for dtypes the vectorized path cannot handle.
+        """
+        a = np.asarray(arr)
+        if a.dtype.kind == 'S':
+            a = np.char.decode(a, 'utf-8', 'ignore')
+        elif a.dtype.kind != 'U':
+            return None
+        # strip then truncate to the first character, matching safe_qc_decode
+        first = np.char.strip(a).astype('U1')
+        return np.where(np.isin(first, _VALID_QC_CHARS), first, '0').tolist()
+
+    def bulk_julian_to_datetime(self, juld_values):
+        """Vectorized enhanced_julian_to_datetime for a whole JULD array
+
+        Converts every profile's JULD in a single pd.to_datetime call
+        instead of one Python-level conversion per profile. Returns a
+        list aligned with the input, with None for missing values or
+        values outside the plausible Argo range (10000-50000 days since
+        1950-01-01).
+        """
+        arr = np.asarray(juld_values)
+
+        try:
+            if np.issubdtype(arr.dtype, np.datetime64):
+                # xarray usually decodes JULD to datetime64 already
+                converted = pd.to_datetime(arr.ravel(), errors='coerce')
+            elif np.issubdtype(arr.dtype, np.number):
+                days = arr.astype('float64').ravel()
+                days = np.where((days >= 10000) & (days <= 50000), days, np.nan)
+                converted = pd.to_datetime(
+                    days, unit='D', origin=pd.Timestamp('1950-01-01'), errors='coerce'
+                )
+            else:
+                # Bytes/strings/mixed arrays keep the careful scalar path
+                return [self.enhanced_julian_to_datetime(v) for v in arr.ravel()]
+        except Exception as e:
+            logger.debug("Bulk Julian conversion failed, falling back to scalar path: %s", e)
+            return [self.enhanced_julian_to_datetime(v) for v in arr.ravel()]
+
+        return [None if pd.isna(ts) else ts.to_pydatetime() for ts in converted]
+
 
 
 
@@ -259,7 +516,7 @@ class UltimateArgoNetCDFParser:
                 return self.safe_float(raw_val)
                 
         except Exception as e:
-            logger.warning(f"Error extracting {var_name}[{meas_idx}]: {e}")
+            logger.warning("Error extracting %s[%s]: %s", var_name, meas_idx, e)
             return default
     def detect_file_type(self, filepath):
         """Detect if file is profile, meta, or trajectory"""
@@ -274,40 +531,67 @@ class UltimateArgoNetCDFParser:
             return 'unknown'
     
     
+    # Per-level variables read in the measurement loop; each is materialized
+    # once per file as a NumPy array instead of per-cell ds[var].values reads
+    _MEASUREMENT_VARS = (
+        'PRES', 'TEMP', 'PSAL',
+        'PRES_QC', 'TEMP_QC', 'PSAL_QC',
+        'PRES_ADJUSTED', 'TEMP_ADJUSTED', 'PSAL_ADJUSTED',
+        'PRES_ADJUSTED_QC', 'TEMP_ADJUSTED_QC', 'PSAL_ADJUSTED_QC',
+        'PRES_ADJUSTED_ERROR', 'TEMP_ADJUSTED_ERROR', 'PSAL_ADJUSTED_ERROR',
+        'DOXY', 'DOXY_QC', 'DOXY_ADJUSTED', 'DOXY_ADJUSTED_QC', 'DOXY_ADJUSTED_ERROR',
+        'NITRATE', 'NITRATE_QC', 'NITRATE_ADJUSTED', 'NITRATE_ADJUSTED_QC', 'NITRATE_ADJUSTED_ERROR',
+        'PH_IN_SITU_TOTAL', 'PH_IN_SITU_TOTAL_QC', 'PH_IN_SITU_TOTAL_ADJUSTED',
+        'PH_IN_SITU_TOTAL_ADJUSTED_QC', 'PH_IN_SITU_TOTAL_ADJUSTED_ERROR',
+    )
+
+    # Per-profile (1-D) variables read in the profile loops, hoisted the
+    # same way as _MEASUREMENT_VARS
+    _PROFILE_VARS = (
+        'CYCLE_NUMBER', 'LATITUDE', 'LONGITUDE', 'DIRECTION', 'DATA_MODE',
+        'POSITION_QC', 'JULD_QC', 'VERTICAL_SAMPLING_SCHEME',
+        'CONFIG_MISSION_NUMBER', 'PROFILE_PRES_QC', 'PROFILE_TEMP_QC',
+        'PROFILE_PSAL_QC',
+    )
+
+    # BGC subset of _MEASUREMENT_VARS; only B-/S-prefixed profile files
+    # (bio and synthetic profiles) carry these
+    _BGC_VARS = (
+        'DOXY', 'DOXY_QC', 'DOXY_ADJUSTED', 'DOXY_ADJUSTED_QC', 'DOXY_ADJUSTED_ERROR',
+        'NITRATE', 'NITRATE_QC', 'NITRATE_ADJUSTED', 'NITRATE_ADJUSTED_QC', 'NITRATE_ADJUSTED_ERROR',
+        'PH_IN_SITU_TOTAL', 'PH_IN_SITU_TOTAL_QC', 'PH_IN_SITU_TOTAL_ADJUSTED',
+        'PH_IN_SITU_TOTAL_ADJUSTED_QC', 'PH_IN_SITU_TOTAL_ADJUSTED_ERROR',
+    )
+
+    # Filename substring -> handler method, checked in order
+    # ('metadata'/'profile'/'trajectory' all contain these keys too)
+    _FILE_TYPE_DISPATCH = (
+        ('meta', 'process_meta_file'),
+        ('prof', 'process_profile_file'),
+        ('traj', 'process_trajectory_file'),
+    )
+
     def process_argo_file(self, filepath):
         """Main file processing dispatcher"""
         filename = os.path.basename(filepath).lower()
-    
-    # Debug: Print filename
+
+        # Debug: Print filename
         logger.info(f"Processing file: {filename}")
-    
-    # Check for meta file patterns
-        if ('meta' in filename or 
-            '_meta.nc' in filename or 
-            filename.endswith('_meta.nc') or
-            'metadata' in filename):
-            logger.info(f"Detected as META file: {filename}")
-            return self.process_meta_file(filepath)
-    
-    # Check for profile file patterns  
-        elif ('prof' in filename or 
-            'profile' in filename or 
-            '_prof.nc' in filename or
-            filename.endswith('_prof.nc')):
-            logger.info(f"Detected as PROFILE file: {filename}")
-            return self.process_profile_file(filepath)
-    
-        elif 'traj' in filename or 'trajectory' in filename:
-            logger.info(f"Detected as TRAJECTORY file: {filename}")
-            return self.process_trajectory_file(filepath)
-    
-    # Unknown file type - try profile first, then meta
-        else:
-            logger.info(f"Unknown file type, trying as profile: {filename}")
+
+        for key, method_name in self._FILE_TYPE_DISPATCH:
+            if key in filename:
+                logger.info(f"Detected as {key.upper()} file: {filename}")
+                # One commit per file instead of one per insert helper
+                with self.transaction():
+                    return getattr(self, method_name)(filepath)
+
+        # Unknown file type - try profile first, then meta
+        logger.info(f"Unknown file type, trying as profile: {filename}")
+        with self.transaction():
             if self.process_profile_file(filepath):
-                 return True
-            else:
-                logger.info(f"Failed as profile, trying as meta: {filename}")
+                return True
+        logger.info(f"Failed as profile, trying as meta: {filename}")
+        with self.transaction():
             return self.process_meta_file(filepath)
 
     def insert_parameter_data(self, param_data_list):
@@ -319,17 +603,19 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            param_data_list = list({(p['platform_number'], p['parameter']): p for p in param_data_list}.values())
+
             param_values = []
             for param_data in param_data_list:
-                # Handle coefficient field properly for JSON
+                # Handle coefficient field properly for JSON - the Json
+                # adapter serializes once at driver level instead of a
+                # per-row json.dumps + extra string allocation
                 coefficient_value = param_data.get('coefficient', '')
-                
+
                 if coefficient_value and str(coefficient_value).lower() not in ['n/a', 'none', '', 'null']:
-                    try:
-                        import json
-                        coefficient_json = json.dumps(str(coefficient_value))
-                    except:
-                        coefficient_json = None
+                    coefficient_json = Json(str(coefficient_value))
                 else:
                     coefficient_json = None
 
@@ -346,18 +632,10 @@ class UltimateArgoNetCDFParser:
                 ))
 
             # ✅ INSERT with DO NOTHING to prevent errors on duplicates
-            sql = """
-            INSERT INTO parameter_table (
-                platform_number, parameter, parameter_sensor, parameter_units,
-                parameter_accuracy, parameter_resolution, predeployment_calib_equation,
-                coefficient, comment
-            ) VALUES %s
-            ON CONFLICT (platform_number, parameter) DO NOTHING
-            """
+            sql = self._SQL_PARAMETER_INSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, param_values)
-            conn.commit()
+            execute_values(cursor, sql, param_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             
             logger.info(f"✅ Processed parameter_table: {len(param_data_list)} parameters (duplicates ignored)")
 
@@ -394,75 +672,104 @@ class UltimateArgoNetCDFParser:
                     return raw_value
             return default
         except Exception as e:
-            logger.debug(f"Error getting {var_name}[{index}]: {e}")
+            logger.debug("Error getting %s[%s]: %s", var_name, index, e)
             return default
 
     def insert_profile_data_with_ids(self, profile_data_list):
-        """Insert profile data list and return mapping of (platform_number, cycle_number, juld) -> profile_id"""
+        """Insert profile data list and return profile_ids aligned with input order
+
+        Returning a positional list (None where an insert failed) lets the
+        measurement loop do profile_ids[prof_idx] instead of hashing a
+        (platform, cycle, juld) tuple per profile - datetime equality
+        quirks in those keys could silently drop measurements.
+        """
         if not profile_data_list:
-            return {}
+            return []
 
         conn = self.connect_postgres()
         cursor = conn.cursor()
-        profile_id_mapping = {}
+        profile_ids = []
 
         try:
+            # The same two statements run once per profile; preparing them
+            # once per session saves the server-side parse/plan on each row
+            self._prepare_once(cursor, 'sel_profile_id', """
+                SELECT profile_id FROM profile_table
+                WHERE platform_number = $1 AND cycle_number = $2 AND juld = $3
+            """)
+            self._prepare_once(cursor, 'ins_profile', """
+                INSERT INTO profile_table (
+                    platform_number, cycle_number, juld, juld_qc, latitude, longitude,
+                    position_qc, direction, data_mode, vertical_sampling_scheme,
+                    config_mission_number, profile_pres_qc, profile_temp_qc, profile_psal_qc
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+                RETURNING profile_id
+            """)
+
             for profile_data in profile_data_list:
                 platform_number = profile_data['platform_number']
                 cycle_number = profile_data['cycle_number']
                 juld = profile_data['juld']
-                
+
                 # First, check if profile already exists
-                cursor.execute("""
-                    SELECT profile_id FROM profile_table 
-                    WHERE platform_number = %s AND cycle_number = %s AND juld = %s
-                """, (platform_number, cycle_number, juld))
-                
+                cursor.execute(
+                    "EXECUTE sel_profile_id (%s, %s, %s)",
+                    (platform_number, cycle_number, juld)
+                )
+
                 existing_profile = cursor.fetchone()
-                
+
                 if existing_profile:
                     # Profile exists, use existing profile_id
                     profile_id = existing_profile[0]
-                    logger.debug(f"Found existing profile {platform_number}/{cycle_number} -> profile_id {profile_id}")
+                    logger.debug("Found existing profile %s/%s -> profile_id %s", platform_number, cycle_number, profile_id)
                 else:
                     # Profile doesn't exist, insert new one
-                    cursor.execute("""
-                        INSERT INTO profile_table (
-                            platform_number, cycle_number, juld, juld_qc, latitude, longitude,
-                            position_qc, direction, data_mode, vertical_sampling_scheme,
-                            config_mission_number, profile_pres_qc, profile_temp_qc, profile_psal_qc
-                        ) VALUES (
-                            %(platform_number)s, %(cycle_number)s, %(juld)s, %(juld_qc)s, 
-                            %(latitude)s, %(longitude)s, %(position_qc)s, %(direction)s,
-                            %(data_mode)s, %(vertical_sampling_scheme)s, %(config_mission_number)s,
-                            %(profile_pres_qc)s, %(profile_temp_qc)s, %(profile_psal_qc)s
-                        ) RETURNING profile_id
-                    """, profile_data)
+                    cursor.execute(
+                        "EXECUTE ins_profile (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                        (
+                            profile_data['platform_number'],
+                            profile_data['cycle_number'],
+                            profile_data['juld'],
+                            profile_data['juld_qc'],
+                            profile_data['latitude'],
+                            profile_data['longitude'],
+                            profile_data['position_qc'],
+                            profile_data['direction'],
+                            profile_data['data_mode'],
+                            profile_data['vertical_sampling_scheme'],
+                            profile_data['config_mission_number'],
+                            profile_data['profile_pres_qc'],
+                            profile_data['profile_temp_qc'],
+                            profile_data['profile_psal_qc']
+                        )
+                    )
                     
                     result = cursor.fetchone()
                     if result:
                         profile_id = result[0]
-                        logger.debug(f"Inserted new profile {platform_number}/{cycle_number} -> profile_id {profile_id}")
+                        logger.debug("Inserted new profile %s/%s -> profile_id %s", platform_number, cycle_number, profile_id)
                     else:
                         logger.error(f"Failed to insert profile {platform_number}/{cycle_number}")
+                        profile_ids.append(None)
                         continue
-                
-                # Create mapping key
-                key = (platform_number, cycle_number, juld)
-                profile_id_mapping[key] = profile_id
 
-            conn.commit()
-            logger.info(f"✅ Processed {len(profile_data_list)} profiles, got {len(profile_id_mapping)} profile IDs")
+                profile_ids.append(profile_id)
+
+            self._commit(conn)
+            resolved = sum(1 for pid in profile_ids if pid is not None)
+            logger.info(f"✅ Processed {len(profile_data_list)} profiles, got {resolved} profile IDs")
 
         except Exception as e:
             conn.rollback()
+            self._prepared.clear()
             logger.error(f"❌ Error processing profiles: {e}")
             logger.error(f"Failed profile data: {profile_data_list}")
             raise
         finally:
             cursor.close()
 
-        return profile_id_mapping
+        return profile_ids
 
 
     def safe_qc_decode(self, value, default='0'):
@@ -491,16 +798,17 @@ class UltimateArgoNetCDFParser:
             
             # Take only the first character
             first_char = decoded[0] if len(decoded) > 0 else default
-            
-            # Validate it's a reasonable QC flag
-            if first_char.isdigit() or first_char.upper() in ['A', 'B', 'C', 'D', 'E', 'F']:
+
+            # Validate it's a reasonable QC flag (single table lookup)
+            code = ord(first_char)
+            if code < 256 and _VALID_QC_TABLE[code]:
                 return first_char
             else:
-                logger.debug(f"Invalid QC flag '{first_char}' from '{repr(value)}', using default '{default}'")
+                logger.debug("Invalid QC flag '%s' from '%r', using default '%s'", first_char, value, default)
                 return default
                 
         except Exception as e:
-            logger.warning(f"Error in safe_qc_decode for value {repr(value)}: {e}")
+            logger.warning("Error in safe_qc_decode for value %r: %s", value, e)
             return default
 
     def process_profile_file(self, filepath):
@@ -508,11 +816,27 @@ class UltimateArgoNetCDFParser:
         logger.info(f"Processing profile file: {filepath}")
 
         try:
-            ds = xr.open_dataset(filepath)
+            # Core-only profile files never carry BGC data, so don't pay for
+            # constructing those dataset objects; B-/S-prefixed files (bio
+            # and synthetic profiles) keep everything. drop_variables
+            # silently ignores names that are absent anyway.
+            basename = os.path.basename(filepath)
+            drop_vars = None if basename[:1].upper() in ('B', 'S') else list(self._BGC_VARS)
+
+            # cache=False: every variable is materialized exactly once into
+            # the hoisted arrays below, so xarray's per-variable cache would
+            # only duplicate them in memory. decode_timedelta matches the
+            # trajectory path.
+            ds = xr.open_dataset(filepath, cache=False, decode_timedelta=False,
+                                 drop_variables=drop_vars)
             logger.info(f"Successfully opened {filepath}")
 
+            # Snapshot attributes once with lowercase keys so we don't hit
+            # xarray's attribute proxy twice per field below
+            attrs_ci = {k.lower(): v for k, v in ds.attrs.items()}
+
             # Extract platform number
-            platform_number = self.safe_decode(ds.attrs.get('platform_number', ''))
+            platform_number = self.safe_decode(attrs_ci.get('platform_number', ''))
             if not platform_number and 'PLATFORM_NUMBER' in ds.variables:
                 platform_values = ds['PLATFORM_NUMBER'].values
                 if platform_values.ndim == 0:
@@ -523,36 +847,38 @@ class UltimateArgoNetCDFParser:
             logger.info(f"Platform number: {platform_number}")
 
             # EXTENSIVE DEBUG FOR PROJECT NAME AND ARRAYS
-            logger.info("=== ATTRIBUTE AND VARIABLE DEBUG START ===")
-            logger.info(f"All NetCDF attributes: {list(ds.attrs.keys())}")
-            logger.info(f"All NetCDF variables: {list(ds.variables.keys())}")
-            
+            # Gate behind DEBUG so repr() of large arrays is never built in production
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== ATTRIBUTE AND VARIABLE DEBUG START ===")
+                logger.debug("All NetCDF attributes: %s", list(ds.attrs.keys()))
+                logger.debug("All NetCDF variables: %s", list(ds.variables.keys()))
+
             # Helper function to parse arrays of bytes
             def parse_byte_array_variable(var_name):
                 """Parse NetCDF variable that contains array of bytes"""
                 if var_name not in ds.variables:
                     return None
-                
+
                 try:
                     var_values = ds[var_name].values
-                    logger.info(f"Raw {var_name} values: {repr(var_values)}")
-                    logger.info(f"{var_name} shape: {var_values.shape}")
-                    logger.info(f"{var_name} dtype: {var_values.dtype}")
-                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Raw %s values: %r", var_name, var_values)
+                        logger.debug("%s shape: %s dtype: %s", var_name, var_values.shape, var_values.dtype)
+
                     # Handle different array structures
                     if hasattr(var_values, '__len__') and len(var_values) > 0:
                         # Take first element and decode
                         first_elem = var_values[0] if var_values.ndim > 0 else var_values
                         decoded_value = self.safe_decode(first_elem)
-                        logger.info(f"Decoded {var_name}: '{decoded_value}'")
+                        logger.debug("Decoded %s: '%s'", var_name, decoded_value)
                         return decoded_value
                     else:
                         decoded_value = self.safe_decode(var_values)
-                        logger.info(f"Decoded {var_name}: '{decoded_value}'")
+                        logger.debug("Decoded %s: '%s'", var_name, decoded_value)
                         return decoded_value
-                        
+
                 except Exception as e:
-                    logger.warning(f"Error parsing {var_name}: {e}")
+                    logger.warning("Error parsing %s: %s", var_name, e)
                     return None
 
             # Check PROJECT_NAME (variable vs attribute)
@@ -562,10 +888,11 @@ class UltimateArgoNetCDFParser:
 
             project_name_upper = ds.attrs.get('PROJECT_NAME')
             project_name_lower = ds.attrs.get('project_name')
-            
-            logger.info(f"PROJECT_NAME from variable: {repr(project_name_from_variable)}")
-            logger.info(f"PROJECT_NAME (upper attr): {repr(project_name_upper)}")
-            logger.info(f"project_name (lower attr): {repr(project_name_lower)}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("PROJECT_NAME from variable: %r", project_name_from_variable)
+                logger.debug("PROJECT_NAME (upper attr): %r", project_name_upper)
+                logger.debug("project_name (lower attr): %r", project_name_lower)
 
             # Check WMO_INST_TYPE (handle array format)
             wmo_inst_from_variable = None
@@ -574,10 +901,11 @@ class UltimateArgoNetCDFParser:
 
             wmo_inst_upper = ds.attrs.get('WMO_INST_TYPE')
             wmo_inst_lower = ds.attrs.get('wmo_inst_type')
-            
-            logger.info(f"WMO_INST_TYPE from variable: {repr(wmo_inst_from_variable)}")
-            logger.info(f"WMO_INST_TYPE (upper attr): {repr(wmo_inst_upper)}")
-            logger.info(f"wmo_inst_type (lower attr): {repr(wmo_inst_lower)}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("WMO_INST_TYPE from variable: %r", wmo_inst_from_variable)
+                logger.debug("WMO_INST_TYPE (upper attr): %r", wmo_inst_upper)
+                logger.debug("wmo_inst_type (lower attr): %r", wmo_inst_lower)
 
             # Check POSITIONING_SYSTEM (handle array format)
             positioning_from_variable = None
@@ -586,47 +914,48 @@ class UltimateArgoNetCDFParser:
 
             positioning_upper = ds.attrs.get('POSITIONING_SYSTEM')
             positioning_lower = ds.attrs.get('positioning_system')
-            
-            logger.info(f"POSITIONING_SYSTEM from variable: {repr(positioning_from_variable)}")
-            logger.info(f"POSITIONING_SYSTEM (upper attr): {repr(positioning_upper)}")
-            logger.info(f"positioning_system (lower attr): {repr(positioning_lower)}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POSITIONING_SYSTEM from variable: %r", positioning_from_variable)
+                logger.debug("POSITIONING_SYSTEM (upper attr): %r", positioning_upper)
+                logger.debug("positioning_system (lower attr): %r", positioning_lower)
 
             # Determine the best sources with priority: variable -> attribute
             final_project_name = ''
             if project_name_from_variable:
                 final_project_name = project_name_from_variable
-                logger.info(f"Using project name from VARIABLE")
+                logger.debug("Using project name from VARIABLE")
             elif project_name_upper:
                 final_project_name = self.safe_decode(project_name_upper)
-                logger.info(f"Using project name from UPPER attribute")
+                logger.debug("Using project name from UPPER attribute")
             elif project_name_lower:
                 final_project_name = self.safe_decode(project_name_lower)
-                logger.info(f"Using project name from LOWER attribute")
+                logger.debug("Using project name from LOWER attribute")
             else:
                 final_project_name = 'Unknown Project'
-                logger.info("No project name found, using default")
+                logger.debug("No project name found, using default")
 
             final_wmo_inst_type = ''
             if wmo_inst_from_variable:
                 final_wmo_inst_type = wmo_inst_from_variable
-                logger.info(f"Using WMO_INST_TYPE from VARIABLE: '{final_wmo_inst_type}'")
+                logger.debug("Using WMO_INST_TYPE from VARIABLE: '%s'", final_wmo_inst_type)
             elif wmo_inst_upper:
                 final_wmo_inst_type = self.safe_decode(wmo_inst_upper)
-                logger.info(f"Using WMO_INST_TYPE from UPPER attribute")
+                logger.debug("Using WMO_INST_TYPE from UPPER attribute")
             elif wmo_inst_lower:
                 final_wmo_inst_type = self.safe_decode(wmo_inst_lower)
-                logger.info(f"Using WMO_INST_TYPE from LOWER attribute")
+                logger.debug("Using WMO_INST_TYPE from LOWER attribute")
 
             final_positioning_system = ''
             if positioning_from_variable:
                 final_positioning_system = positioning_from_variable
-                logger.info(f"Using POSITIONING_SYSTEM from VARIABLE: '{final_positioning_system}'")
+                logger.debug("Using POSITIONING_SYSTEM from VARIABLE: '%s'", final_positioning_system)
             elif positioning_upper:
                 final_positioning_system = self.safe_decode(positioning_upper)
-                logger.info(f"Using POSITIONING_SYSTEM from UPPER attribute")
+                logger.debug("Using POSITIONING_SYSTEM from UPPER attribute")
             elif positioning_lower:
                 final_positioning_system = self.safe_decode(positioning_lower)
-                logger.info(f"Using POSITIONING_SYSTEM from LOWER attribute")
+                logger.debug("Using POSITIONING_SYSTEM from LOWER attribute")
 
             # CRITICAL: Ensure proper string format and length limits
             final_project_name = str(final_project_name).strip()
@@ -637,10 +966,11 @@ class UltimateArgoNetCDFParser:
             final_wmo_inst_type = str(final_wmo_inst_type).strip()[:10]
             final_positioning_system = str(final_positioning_system).strip()[:50]
 
-            logger.info(f"FINAL project_name: '{final_project_name}' (length: {len(final_project_name)})")
-            logger.info(f"FINAL wmo_inst_type: '{final_wmo_inst_type}' (length: {len(final_wmo_inst_type)})")
-            logger.info(f"FINAL positioning_system: '{final_positioning_system}' (length: {len(final_positioning_system)})")
-            logger.info("=== ATTRIBUTE AND VARIABLE DEBUG END ===")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FINAL project_name: '%s' (length: %d)", final_project_name, len(final_project_name))
+                logger.debug("FINAL wmo_inst_type: '%s' (length: %d)", final_wmo_inst_type, len(final_wmo_inst_type))
+                logger.debug("FINAL positioning_system: '%s' (length: %d)", final_positioning_system, len(final_positioning_system))
+                logger.debug("=== ATTRIBUTE AND VARIABLE DEBUG END ===")
 
             # 1. FLOAT_TABLE - Basic info with PROPER string handling
             float_data = {
@@ -654,210 +984,229 @@ class UltimateArgoNetCDFParser:
             self.insert_float_data(float_data)
 
             # 1.5. META_TABLE - Extract float-level metadata ONCE per float
-            conn = self.connect_postgres()
-            cursor = conn.cursor()
-            try:
-                cursor.execute("SELECT COUNT(*) FROM meta_table WHERE platform_number = %s", (platform_number,))
-                meta_exists = cursor.fetchone()[0] > 0
-            except:
-                meta_exists = False
-            finally:
-                cursor.close()
-                conn.close()
-
-            # Only insert meta data if it doesn't exist for this float
-            # Replace your existing profile_meta_data section with this complete version:
+            # The UNIQUE(platform_number) constraint + ON CONFLICT DO NOTHING
+            # keeps the "insert once per float" invariant without a
+            # SELECT COUNT(*) round-trip per file (and is safe under
+            # concurrent ingestion)
+            profile_meta_data = {
+                'platform_number': platform_number,
+                'data_type': self.safe_decode(attrs_ci.get('data_type', 'Argo profile')),
+                'format_version': self.safe_decode(attrs_ci.get('format_version', '')),
+                'handbook_version': self.safe_decode(attrs_ci.get('handbook_version', '')),
+                'date_creation': self.argo_date_to_datetime(attrs_ci.get('date_creation', '')),
+                'date_update': self.argo_date_to_datetime(attrs_ci.get('date_update', '')),
+
+                # ✅ ADD ALL THE MISSING FIELDS HERE
+                'ptt': self.safe_decode(attrs_ci.get('ptt', '')),
+                'trans_system': self.safe_decode(attrs_ci.get('trans_system', '')),
+                'trans_system_id': self.safe_decode(attrs_ci.get('trans_system_id', '')),
+                'trans_frequency': self.safe_decode(attrs_ci.get('trans_frequency', '')),
+
+                'positioning_system': final_positioning_system,
+                'platform_family': self.safe_decode(attrs_ci.get('platform_family', '')),
+                'platform_type': self.safe_decode(attrs_ci.get('platform_type', '')),
+                'platform_maker': self.safe_decode(attrs_ci.get('platform_maker', '')),
+                'firmware_version': self.safe_decode(attrs_ci.get('firmware_version', '')),
+
+                # ✅ MORE MISSING FIELDS
+                'manual_version': self.safe_decode(attrs_ci.get('manual_version', '')),
+                'float_serial_no': self.safe_decode(attrs_ci.get('float_serial_no', '')),
+                'dac_format_id': self.safe_decode(attrs_ci.get('dac_format_id', '')),
 
-            if not meta_exists:
-                profile_meta_data = {
-                    'platform_number': platform_number,
-                    'data_type': self.safe_decode(ds.attrs.get('DATA_TYPE') or ds.attrs.get('data_type') or 'Argo profile'),
-                    'format_version': self.safe_decode(ds.attrs.get('FORMAT_VERSION') or ds.attrs.get('format_version') or ''),
-                    'handbook_version': self.safe_decode(ds.attrs.get('HANDBOOK_VERSION') or ds.attrs.get('handbook_version') or ''),
-                    'date_creation': self.argo_date_to_datetime(ds.attrs.get('DATE_CREATION') or ds.attrs.get('date_creation') or ''),
-                    'date_update': self.argo_date_to_datetime(ds.attrs.get('DATE_UPDATE') or ds.attrs.get('date_update') or ''),
-                    
-                    # ✅ ADD ALL THE MISSING FIELDS HERE
-                    'ptt': self.safe_decode(ds.attrs.get('PTT') or ds.attrs.get('ptt') or ''),
-                    'trans_system': self.safe_decode(ds.attrs.get('TRANS_SYSTEM') or ds.attrs.get('trans_system') or ''),
-                    'trans_system_id': self.safe_decode(ds.attrs.get('TRANS_SYSTEM_ID') or ds.attrs.get('trans_system_id') or ''),
-                    'trans_frequency': self.safe_decode(ds.attrs.get('TRANS_FREQUENCY') or ds.attrs.get('trans_frequency') or ''),
-                    
-                    'positioning_system': final_positioning_system,
-                    'platform_family': self.safe_decode(ds.attrs.get('PLATFORM_FAMILY') or ds.attrs.get('platform_family') or ''),
-                    'platform_type': self.safe_decode(ds.attrs.get('PLATFORM_TYPE') or ds.attrs.get('platform_type') or ''),
-                    'platform_maker': self.safe_decode(ds.attrs.get('PLATFORM_MAKER') or ds.attrs.get('platform_maker') or ''),
-                    'firmware_version': self.safe_decode(ds.attrs.get('FIRMWARE_VERSION') or ds.attrs.get('firmware_version') or ''),
-                    
-                    # ✅ MORE MISSING FIELDS
-                    'manual_version': self.safe_decode(ds.attrs.get('MANUAL_VERSION') or ds.attrs.get('manual_version') or ''),
-                    'float_serial_no': self.safe_decode(ds.attrs.get('FLOAT_SERIAL_NO') or ds.attrs.get('float_serial_no') or ''),
-                    'dac_format_id': self.safe_decode(ds.attrs.get('DAC_FORMAT_ID') or ds.attrs.get('dac_format_id') or ''),
-                    
-                    'wmo_inst_type': final_wmo_inst_type,
-                    'project_name': final_project_name,
-                    'data_centre': self.safe_decode(ds.attrs.get('DATA_CENTRE') or ds.attrs.get('data_centre') or ''),
-                    'pi_name': self.safe_decode(ds.attrs.get('PI_NAME') or ds.attrs.get('pi_name') or ''),
-                    
-                    # ✅ MORE MISSING FIELDS
-                    'anomaly': self.safe_decode(ds.attrs.get('ANOMALY') or ds.attrs.get('anomaly') or ''),
-                    'battery_type': self.safe_decode(ds.attrs.get('BATTERY_TYPE') or ds.attrs.get('battery_type') or ''),
-                    'battery_packs': self.safe_int(ds.attrs.get('BATTERY_PACKS') or ds.attrs.get('battery_packs')),
-                    'controller_board_type_primary': self.safe_decode(ds.attrs.get('CONTROLLER_BOARD_TYPE_PRIMARY') or ds.attrs.get('controller_board_type_primary') or ''),
-                    'controller_board_type_secondary': self.safe_decode(ds.attrs.get('CONTROLLER_BOARD_TYPE_SECONDARY') or ds.attrs.get('controller_board_type_secondary') or ''),
-                    'serial_no_primary': self.safe_decode(ds.attrs.get('SERIAL_NO_PRIMARY') or ds.attrs.get('serial_no_primary') or ''),
-                    'serial_no_secondary': self.safe_decode(ds.attrs.get('SERIAL_NO_SECONDARY') or ds.attrs.get('serial_no_secondary') or ''),
-                    'special_features': self.safe_decode(ds.attrs.get('SPECIAL_FEATURES') or ds.attrs.get('special_features') or ''),
-                    'float_owner': self.safe_decode(ds.attrs.get('FLOAT_OWNER') or ds.attrs.get('float_owner') or ''),
-                    'operating_institution': self.safe_decode(ds.attrs.get('OPERATING_INSTITUTION') or ds.attrs.get('operating_institution') or ''),
-                    'customisation': self.safe_decode(ds.attrs.get('CUSTOMISATION') or ds.attrs.get('customisation') or ''),
-                    
-                    'launch_date': self.argo_date_to_datetime(ds.attrs.get('LAUNCH_DATE') or ds.attrs.get('launch_date') or ''),
-                    'launch_latitude': self.safe_float(ds.attrs.get('LAUNCH_LATITUDE') or ds.attrs.get('launch_latitude')),
-                    'launch_longitude': self.safe_float(ds.attrs.get('LAUNCH_LONGITUDE') or ds.attrs.get('launch_longitude')),
-                    'launch_qc': self.safe_decode(ds.attrs.get('LAUNCH_QC') or ds.attrs.get('launch_qc') or ''),
-                    
-                    'start_date': self.argo_date_to_datetime(ds.attrs.get('START_DATE') or ds.attrs.get('start_date') or ''),
-                    'start_date_qc': self.safe_decode(ds.attrs.get('START_DATE_QC') or ds.attrs.get('start_date_qc') or ''),
-                    'startup_date': self.argo_date_to_datetime(ds.attrs.get('STARTUP_DATE') or ds.attrs.get('startup_date') or ''),
-                    'startup_date_qc': self.safe_decode(ds.attrs.get('STARTUP_DATE_QC') or ds.attrs.get('startup_date_qc') or ''),
-                    
-                    'end_mission_date': self.argo_date_to_datetime(ds.attrs.get('END_MISSION_DATE') or ds.attrs.get('end_mission_date') or ''),
-                    'end_mission_status': self.safe_decode(ds.attrs.get('END_MISSION_STATUS') or ds.attrs.get('end_mission_status') or '')
-                }
+                'wmo_inst_type': final_wmo_inst_type,
+                'project_name': final_project_name,
+                'data_centre': self.safe_decode(attrs_ci.get('data_centre', '')),
+                'pi_name': self.safe_decode(attrs_ci.get('pi_name', '')),
+
+                # ✅ MORE MISSING FIELDS
+                'anomaly': self.safe_decode(attrs_ci.get('anomaly', '')),
+                'battery_type': self.safe_decode(attrs_ci.get('battery_type', '')),
+                'battery_packs': self.safe_int(attrs_ci.get('battery_packs')),
+                'controller_board_type_primary': self.safe_decode(attrs_ci.get('controller_board_type_primary', '')),
+                'controller_board_type_secondary': self.safe_decode(attrs_ci.get('controller_board_type_secondary', '')),
+                'serial_no_primary': self.safe_decode(attrs_ci.get('serial_no_primary', '')),
+                'serial_no_secondary': self.safe_decode(attrs_ci.get('serial_no_secondary', '')),
+                'special_features': self.safe_decode(attrs_ci.get('special_features', '')),
+                'float_owner': self.safe_decode(attrs_ci.get('float_owner', '')),
+                'operating_institution': self.safe_decode(attrs_ci.get('operating_institution', '')),
+                'customisation': self.safe_decode(attrs_ci.get('customisation', '')),
+
+                'launch_date': self.argo_date_to_datetime(attrs_ci.get('launch_date', '')),
+                'launch_latitude': self.safe_float(attrs_ci.get('launch_latitude')),
+                'launch_longitude': self.safe_float(attrs_ci.get('launch_longitude')),
+                'launch_qc': self.safe_decode(attrs_ci.get('launch_qc', '')),
+
+                'start_date': self.argo_date_to_datetime(attrs_ci.get('start_date', '')),
+                'start_date_qc': self.safe_decode(attrs_ci.get('start_date_qc', '')),
+                'startup_date': self.argo_date_to_datetime(attrs_ci.get('startup_date', '')),
+                'startup_date_qc': self.safe_decode(attrs_ci.get('startup_date_qc', '')),
+
+                'end_mission_date': self.argo_date_to_datetime(attrs_ci.get('end_mission_date', '')),
+                'end_mission_status': self.safe_decode(attrs_ci.get('end_mission_status', ''))
+            }
 
-                # Only insert if we have meaningful metadata
-                meaningful_fields = [
-                    profile_meta_data['pi_name'], 
-                    profile_meta_data['project_name'], 
-                    profile_meta_data['data_centre'],
-                    profile_meta_data['platform_type'],
-                    profile_meta_data['platform_maker']
-                ]
+            # Only insert if we have meaningful metadata
+            meaningful_fields = [
+                profile_meta_data['pi_name'], 
+                profile_meta_data['project_name'], 
+                profile_meta_data['data_centre'],
+                profile_meta_data['platform_type'],
+                profile_meta_data['platform_maker']
+            ]
                 
-                if any(field and field not in ['Unknown Project', ''] and field.strip() for field in meaningful_fields):
-                    self.insert_meta_data(profile_meta_data)
-                    logger.info(f"✅ Inserted metadata with project: '{final_project_name}' for platform {platform_number}")
-                else:
-                    logger.info(f"ℹ️ No meaningful metadata found for platform {platform_number}")
-
+            if any(field and field not in ['Unknown Project', ''] and field.strip() for field in meaningful_fields):
+                # DO NOTHING so profile-derived attrs never clobber a meta.nc row
+                self.insert_meta_data(profile_meta_data, update_existing=False)
+                logger.info(f"✅ Inserted metadata with project: '{final_project_name}' for platform {platform_number}")
             else:
-                logger.info(f"ℹ️ Metadata already exists for platform {platform_number}, skipping")
+                logger.info(f"ℹ️ No meaningful metadata found for platform {platform_number}")
+
 
             # Rest of your existing profile and measurement processing...
             profiles = []
             n_prof = ds.sizes.get('N_PROF', 1)
 
-            for prof_idx in range(n_prof):
-                juld_val = None
-                if 'JULD' in ds:
-                    raw_juld = ds['JULD'].values[prof_idx]
-                    juld_val = self.enhanced_julian_to_datetime(raw_juld)
+            # Plain-set membership is O(1); 'VAR' in ds runs xarray's
+            # Dataset containment machinery on every check
+            ds_vars = set(ds.variables)
 
+            # Convert all JULD values in one vectorized pass instead of
+            # per-profile enhanced_julian_to_datetime calls
+            if 'JULD' in ds_vars:
+                juld_by_profile = self.bulk_julian_to_datetime(ds['JULD'].values)
+            else:
+                juld_by_profile = [None] * n_prof
+
+            # Hoist the per-profile variables out of the loop as well - one
+            # .values materialization per variable instead of one xarray
+            # dispatch per profile per field
+            prof_arrs = {
+                name: (ds[name].values if name in ds_vars else None)
+                for name in self._PROFILE_VARS
+            }
+
+            # Bulk-convert each column once: .tolist() is a single C-level
+            # pass, so the safe_* helpers see plain Python scalars instead
+            # of NumPy scalars needing .item() handling per profile
+            def prof_column(name, conv, default=None):
+                arr = prof_arrs[name]
+                if arr is None:
+                    return [conv(default)] * n_prof
+                return [conv(v) for v in np.asarray(arr).tolist()]
+
+            cycle_col = prof_column('CYCLE_NUMBER', self.safe_int)
+            lat_col = prof_column('LATITUDE', self.safe_float)
+            lon_col = prof_column('LONGITUDE', self.safe_float)
+            direction_col = prof_column('DIRECTION', self.safe_decode, 'A')
+            data_mode_col = prof_column('DATA_MODE', self.safe_decode, 'R')
+            position_qc_col = prof_column('POSITION_QC', self.safe_decode, '0')
+            juld_qc_col = prof_column('JULD_QC', self.safe_decode, '0')
+            sampling_scheme_col = prof_column('VERTICAL_SAMPLING_SCHEME', self.safe_decode, '')
+            mission_number_col = prof_column('CONFIG_MISSION_NUMBER', self.safe_int)
+            profile_pres_qc_col = prof_column('PROFILE_PRES_QC', self.safe_decode, '')
+            profile_temp_qc_col = prof_column('PROFILE_TEMP_QC', self.safe_decode, '')
+            profile_psal_qc_col = prof_column('PROFILE_PSAL_QC', self.safe_decode, '')
+
+            for prof_idx in range(n_prof):
                 profile_data = {
                     'platform_number': platform_number,
-                    'cycle_number': self.safe_int(ds['CYCLE_NUMBER'].values[prof_idx] if 'CYCLE_NUMBER' in ds else None),
-                    'latitude': self.safe_float(ds['LATITUDE'].values[prof_idx] if 'LATITUDE' in ds else None),
-                    'longitude': self.safe_float(ds['LONGITUDE'].values[prof_idx] if 'LONGITUDE' in ds else None),
-                    'juld': juld_val,
-                    'direction': self.safe_decode(ds['DIRECTION'].values[prof_idx] if 'DIRECTION' in ds else 'A'),
-                    'data_mode': self.safe_decode(ds['DATA_MODE'].values[prof_idx] if 'DATA_MODE' in ds else 'R'),
-                    'position_qc': self.safe_decode(ds['POSITION_QC'].values[prof_idx] if 'POSITION_QC' in ds else '0'),
-                    'juld_qc': self.safe_decode(ds['JULD_QC'].values[prof_idx] if 'JULD_QC' in ds else '0'),
-                    'vertical_sampling_scheme': self.safe_decode(ds['VERTICAL_SAMPLING_SCHEME'].values[prof_idx] if 'VERTICAL_SAMPLING_SCHEME' in ds else ''),
-                    'config_mission_number': self.safe_int(ds['CONFIG_MISSION_NUMBER'].values[prof_idx] if 'CONFIG_MISSION_NUMBER' in ds else None),
-                    'profile_pres_qc': self.safe_decode(ds['PROFILE_PRES_QC'].values[prof_idx] if 'PROFILE_PRES_QC' in ds else ''),
-                    'profile_temp_qc': self.safe_decode(ds['PROFILE_TEMP_QC'].values[prof_idx] if 'PROFILE_TEMP_QC' in ds else ''),
-                    'profile_psal_qc': self.safe_decode(ds['PROFILE_PSAL_QC'].values[prof_idx] if 'PROFILE_PSAL_QC' in ds else '')
+                    'cycle_number': cycle_col[prof_idx],
+                    'latitude': lat_col[prof_idx],
+                    'longitude': lon_col[prof_idx],
+                    'juld': juld_by_profile[prof_idx],
+                    'direction': direction_col[prof_idx],
+                    'data_mode': data_mode_col[prof_idx],
+                    'position_qc': position_qc_col[prof_idx],
+                    'juld_qc': juld_qc_col[prof_idx],
+                    'vertical_sampling_scheme': sampling_scheme_col[prof_idx],
+                    'config_mission_number': mission_number_col[prof_idx],
+                    'profile_pres_qc': profile_pres_qc_col[prof_idx],
+                    'profile_temp_qc': profile_temp_qc_col[prof_idx],
+                    'profile_psal_qc': profile_psal_qc_col[prof_idx]
                 }
                 profiles.append(profile_data)
 
             # ✅ Insert profiles and get the profile_ids using your helper function
-            profile_id_mapping = self.insert_profile_data_with_ids(profiles)
-            logger.info(f"✅ Inserted {len(profiles)} profiles, got {len(profile_id_mapping)} profile IDs")
+            profile_ids = self.insert_profile_data_with_ids(profiles)
+            resolved_ids = sum(1 for pid in profile_ids if pid is not None)
+            logger.info(f"✅ Inserted {len(profiles)} profiles, got {resolved_ids} profile IDs")
 
             # ✅ UPDATED DEPTHS LOGIC - Link to profile_id
-            measurements = []
+            # Measurements are assembled column-wise into a DataFrame (one
+            # flat array per column) rather than one 30-key dict per row;
+            # insert_measurement_data streams the frame straight into COPY
+            measurements = pd.DataFrame()
             if 'N_LEVELS' in ds.sizes:
                 n_levels = ds.sizes['N_LEVELS']
 
-                for prof_idx in range(n_prof):
-                    cycle_number = self.safe_int(ds['CYCLE_NUMBER'].values[prof_idx] if 'CYCLE_NUMBER' in ds else None)
-                    prof_lat = self.safe_float(ds['LATITUDE'].values[prof_idx] if 'LATITUDE' in ds else None)
-                    prof_lon = self.safe_float(ds['LONGITUDE'].values[prof_idx] if 'LONGITUDE' in ds else None)
-                    
-                    # Get JULD for this profile to match with profile_id
-                    juld_val = None
-                    if 'JULD' in ds:
-                        raw_juld = ds['JULD'].values[prof_idx]
-                        juld_val = self.enhanced_julian_to_datetime(raw_juld)
-
-                    # ✅ Find the corresponding profile_id using your helper function mapping
-                    profile_id = profile_id_mapping.get((platform_number, cycle_number, juld_val))
-                    if not profile_id:
-                        logger.warning(f"Could not find profile_id for profile {prof_idx}, cycle {cycle_number}")
-                        continue
+                # Materialize every measurement variable once per file;
+                # per-cell ds[var].values[i, j] repeats the xarray dispatch
+                # and backend read for every level of every profile
+                arrs = {
+                    name: (ds[name].values if name in ds_vars else None)
+                    for name in self._MEASUREMENT_VARS
+                }
 
-                    for level_idx in range(n_levels):
-                        pres = self.safe_float(ds['PRES'].values[prof_idx, level_idx] if 'PRES' in ds else None)
-                        temp = self.safe_float(ds['TEMP'].values[prof_idx, level_idx] if 'TEMP' in ds else None)
-                        psal = self.safe_float(ds['PSAL'].values[prof_idx, level_idx] if 'PSAL' in ds else None)
-
-                        if all(x is None for x in [pres, temp, psal]):
-                            continue
-
-                        # In your process_profile_file function, replace the measurement creation with this:
-
-                        measurement = {
-                            'profile_id': profile_id,  # ✅ NOW WE HAVE THE PROFILE_ID!
-                            'platform_number': platform_number,
-                            'cycle_number': cycle_number,
-                            'latitude': prof_lat,
-                            'longitude': prof_lon,
-                            'pres': pres,
-                            'temp': temp,
-                            'psal': psal,
-                            
-                            # ✅ Use safe_qc_decode for all QC fields
-                            'pres_qc': self.safe_qc_decode(ds['PRES_QC'].values[prof_idx, level_idx] if 'PRES_QC' in ds else '0'),
-                            'temp_qc': self.safe_qc_decode(ds['TEMP_QC'].values[prof_idx, level_idx] if 'TEMP_QC' in ds else '0'),
-                            'psal_qc': self.safe_qc_decode(ds['PSAL_QC'].values[prof_idx, level_idx] if 'PSAL_QC' in ds else '0'),
-                            
-                            # Adjusted values
-                            'pres_adjusted': self.safe_float(ds['PRES_ADJUSTED'].values[prof_idx, level_idx] if 'PRES_ADJUSTED' in ds else None),
-                            'temp_adjusted': self.safe_float(ds['TEMP_ADJUSTED'].values[prof_idx, level_idx] if 'TEMP_ADJUSTED' in ds else None),
-                            'psal_adjusted': self.safe_float(ds['PSAL_ADJUSTED'].values[prof_idx, level_idx] if 'PSAL_ADJUSTED' in ds else None),
-                            
-                            # ✅ Adjusted QC fields with safe_qc_decode
-                            'pres_adjusted_qc': self.safe_qc_decode(ds['PRES_ADJUSTED_QC'].values[prof_idx, level_idx] if 'PRES_ADJUSTED_QC' in ds else '0'),
-                            'temp_adjusted_qc': self.safe_qc_decode(ds['TEMP_ADJUSTED_QC'].values[prof_idx, level_idx] if 'TEMP_ADJUSTED_QC' in ds else '0'),
-                            'psal_adjusted_qc': self.safe_qc_decode(ds['PSAL_ADJUSTED_QC'].values[prof_idx, level_idx] if 'PSAL_ADJUSTED_QC' in ds else '0'),
-                            
-                            'pres_adjusted_error': self.safe_float(ds['PRES_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'PRES_ADJUSTED_ERROR' in ds else None),
-                            'temp_adjusted_error': self.safe_float(ds['TEMP_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'TEMP_ADJUSTED_ERROR' in ds else None),
-                            'psal_adjusted_error': self.safe_float(ds['PSAL_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'PSAL_ADJUSTED_ERROR' in ds else None),
-                            
-                            # BGC parameters
-                            'doxy': self.safe_float(ds['DOXY'].values[prof_idx, level_idx] if 'DOXY' in ds else None),
-                            'doxy_qc': self.safe_qc_decode(ds['DOXY_QC'].values[prof_idx, level_idx] if 'DOXY_QC' in ds else '0'),
-                            'doxy_adjusted': self.safe_float(ds['DOXY_ADJUSTED'].values[prof_idx, level_idx] if 'DOXY_ADJUSTED' in ds else None),
-                            'doxy_adjusted_qc': self.safe_qc_decode(ds['DOXY_ADJUSTED_QC'].values[prof_idx, level_idx] if 'DOXY_ADJUSTED_QC' in ds else '0'),
-                            'doxy_adjusted_error': self.safe_float(ds['DOXY_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'DOXY_ADJUSTED_ERROR' in ds else None),
-                            
-                            'nitrate': self.safe_float(ds['NITRATE'].values[prof_idx, level_idx] if 'NITRATE' in ds else None),
-                            'nitrate_qc': self.safe_qc_decode(ds['NITRATE_QC'].values[prof_idx, level_idx] if 'NITRATE_QC' in ds else '0'),
-                            'nitrate_adjusted': self.safe_float(ds['NITRATE_ADJUSTED'].values[prof_idx, level_idx] if 'NITRATE_ADJUSTED' in ds else None),
-                            'nitrate_adjusted_qc': self.safe_qc_decode(ds['NITRATE_ADJUSTED_QC'].values[prof_idx, level_idx] if 'NITRATE_ADJUSTED_QC' in ds else '0'),
-                            'nitrate_adjusted_error': self.safe_float(ds['NITRATE_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'NITRATE_ADJUSTED_ERROR' in ds else None),
-                            
-                            'ph_in_situ_total': self.safe_float(ds['PH_IN_SITU_TOTAL'].values[prof_idx, level_idx] if 'PH_IN_SITU_TOTAL' in ds else None),
-                            'ph_in_situ_total_qc': self.safe_qc_decode(ds['PH_IN_SITU_TOTAL_QC'].values[prof_idx, level_idx] if 'PH_IN_SITU_TOTAL_QC' in ds else '0'),
-                            'ph_in_situ_total_adjusted': self.safe_float(ds['PH_IN_SITU_TOTAL_ADJUSTED'].values[prof_idx, level_idx] if 'PH_IN_SITU_TOTAL_ADJUSTED' in ds else None),
-                            'ph_in_situ_total_adjusted_qc': self.safe_qc_decode(ds['PH_IN_SITU_TOTAL_ADJUSTED_QC'].values[prof_idx, level_idx] if 'PH_IN_SITU_TOTAL_ADJUSTED_QC' in ds else '0'),
-                            'ph_in_situ_total_adjusted_error': self.safe_float(ds['PH_IN_SITU_TOTAL_ADJUSTED_ERROR'].values[prof_idx, level_idx] if 'PH_IN_SITU_TOTAL_ADJUSTED_ERROR' in ds else None)
-                        }
+                # Rows are kept when at least one of PRES/TEMP/PSAL is
+                # finite; computing the mask in one vectorized pass replaces
+                # the per-level all-None check
+                finite_cores = []
+                for core_name in ('PRES', 'TEMP', 'PSAL'):
+                    core_arr = arrs[core_name]
+                    if core_arr is None:
+                        continue
+                    try:
+                        finite_cores.append(np.isfinite(np.asarray(core_arr, dtype='float64')))
+                    except (TypeError, ValueError):
+                        continue
+                valid_mask = np.logical_or.reduce(finite_cores) if finite_cores else None
+
+                # Per-profile columns, repeated across levels below. The
+                # inputs are all cached columns aligned on prof_idx, so no
+                # second per-profile pass over the dataset is needed.
+                profile_id_by_prof = np.array(profile_ids, dtype=object)
+                cycle_by_prof = np.array(cycle_col, dtype=object)
+                lat_by_prof = np.array(lat_col, dtype=object)
+                lon_by_prof = np.array(lon_col, dtype=object)
+                have_profile_id = np.array([pid is not None for pid in profile_ids], dtype=bool)
+
+                for prof_idx in np.flatnonzero(~have_profile_id):
+                    logger.warning("Could not find profile_id for profile %s, cycle %s", prof_idx, cycle_col[prof_idx])
+
+                if valid_mask is not None and have_profile_id.any():
+                    row_idx = np.flatnonzero((valid_mask & have_profile_id[:, None]).ravel())
+                else:
+                    row_idx = np.array([], dtype=int)
+
+                if row_idx.size:
+                    def flat_column(name):
+                        """Flattened, bulk-converted column for the kept rows"""
+                        arr = arrs[name]
+                        if name.endswith('_QC'):
+                            if arr is None:
+                                return np.full(row_idx.size, '0', dtype=object)
+                            decoded = self._bulk_qc_decode(arr)
+                            if decoded is None:
+                                return np.array([self.safe_qc_decode(v) for v in np.asarray(arr).ravel()[row_idx]], dtype=object)
+                            return np.asarray(decoded, dtype=object).ravel()[row_idx]
+                        if arr is None:
+                            return np.full(row_idx.size, None, dtype=object)
+                        converted = self._bulk_safe_float(arr)
+                        if converted is None:
+                            return np.array([self.safe_float(v) for v in np.asarray(arr).ravel()[row_idx]], dtype=object)
+                        return np.asarray(converted, dtype=object).ravel()[row_idx]
+
+                    columns = {
+                        'profile_id': np.repeat(profile_id_by_prof, n_levels)[row_idx],
+                        'platform_number': np.full(row_idx.size, platform_number, dtype=object),
+                        'cycle_number': np.repeat(cycle_by_prof, n_levels)[row_idx],
+                        'latitude': np.repeat(lat_by_prof, n_levels)[row_idx],
+                        'longitude': np.repeat(lon_by_prof, n_levels)[row_idx],
+                    }
+                    for name in self._MEASUREMENT_VARS:
+                        columns[name.lower()] = flat_column(name)
 
-                        measurements.append(measurement)
+                    measurements = pd.DataFrame(columns)
 
             self.insert_measurement_data(measurements)
             ds.close()
@@ -868,16 +1217,30 @@ class UltimateArgoNetCDFParser:
 
             return True
 
-        except Exception as e:
-            logger.error(f"❌ Error processing profile file: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            # logger.exception carries the traceback through the configured
+            # handlers instead of a synchronous stderr flush
+            logger.exception("❌ Error processing profile file")
             return False
 
 
 
     # INSERT METHODS FOR ALL 15 TABLES
 
+    # float_table column width limits; keeping the truncation policy in one
+    # place so COPY/normalization code has a single rule to apply
+    _FLOAT_COLUMN_LIMITS = {
+        'platform_number': 20,
+        'project_name': 100,
+        'wmo_inst_type': 10,
+        'positioning_system': 50,
+    }
+
+    @staticmethod
+    def _truncate_row(row, limits):
+        """Stringify and truncate row fields to the given column widths"""
+        return {k: str(row.get(k, ''))[:n] for k, n in limits.items()}
+
     def insert_float_data(self, float_data):
         """Insert float data with length validation"""
         if not float_data.get('platform_number'):
@@ -885,12 +1248,7 @@ class UltimateArgoNetCDFParser:
             return
 
         # Ensure all strings are properly sized
-        safe_data = {
-            'platform_number': str(float_data['platform_number'])[:20],
-            'project_name': str(float_data.get('project_name', ''))[:100],
-            'wmo_inst_type': str(float_data.get('wmo_inst_type', ''))[:10],
-            'positioning_system': str(float_data.get('positioning_system', ''))[:50]
-        }
+        safe_data = self._truncate_row(float_data, self._FLOAT_COLUMN_LIMITS)
 
         logger.info(f"Safe data to insert: {safe_data}")
 
@@ -898,19 +1256,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
-            sql = """
-            INSERT INTO float_table (platform_number, project_name, wmo_inst_type, positioning_system)
-            VALUES (%(platform_number)s, %(project_name)s, %(wmo_inst_type)s, %(positioning_system)s)
-            ON CONFLICT (platform_number) 
-            DO UPDATE SET
-                project_name = EXCLUDED.project_name,
-                wmo_inst_type = EXCLUDED.wmo_inst_type,
-                positioning_system = EXCLUDED.positioning_system,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_FLOAT_UPSERT
             
             cursor.execute(sql, safe_data)
-            conn.commit()
+            self._commit(conn)
             logger.info(f"✅ Successfully inserted/updated float data for {safe_data['platform_number']}")
 
         except Exception as e:
@@ -951,26 +1300,15 @@ class UltimateArgoNetCDFParser:
                 profile.get('profile_psal_qc', '')
             ))
 
-            sql = """
-            INSERT INTO profile_table (
-            platform_number, cycle_number, juld, juld_qc, latitude, longitude,
-            position_qc, direction, data_mode, vertical_sampling_scheme, 
-            config_mission_number, profile_pres_qc, profile_temp_qc, profile_psal_qc
-            ) VALUES %s
-            ON CONFLICT (platform_number, cycle_number, direction) DO UPDATE SET
-            juld = EXCLUDED.juld,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            vertical_sampling_scheme = EXCLUDED.vertical_sampling_scheme,
-            config_mission_number = EXCLUDED.config_mission_number,
-            profile_pres_qc = EXCLUDED.profile_pres_qc,
-            profile_temp_qc = EXCLUDED.profile_temp_qc,
-            profile_psal_qc = EXCLUDED.profile_psal_qc
-            """
+            sql = self._SQL_PROFILE_UPSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, profile_values)
-            conn.commit()
+            # Explicit template skips psycopg2's per-page template inference
+            execute_values(
+                cursor, sql, profile_values,
+                template="(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)",
+                page_size=EXECUTE_VALUES_PAGE_SIZE
+            )
+            self._commit(conn)
             logger.info(f"Updated profile_table: {len(profiles)} profiles")
 
         except Exception as e:
@@ -980,8 +1318,13 @@ class UltimateArgoNetCDFParser:
         finally:
             cursor.close()
 
-    def insert_meta_data(self, meta_data):
-        """Insert into meta_table - FULL SCHEMA MATCH with complete UPDATE"""
+    def insert_meta_data(self, meta_data, update_existing=True):
+        """Insert into meta_table - FULL SCHEMA MATCH with complete UPDATE
+
+        update_existing=True (meta files) refreshes every column on conflict;
+        update_existing=False (profile-derived metadata) does ON CONFLICT DO
+        NOTHING so a richer meta.nc row is never overwritten.
+        """
         conn = self.connect_postgres()
         cursor = conn.cursor()
 
@@ -990,9 +1333,10 @@ class UltimateArgoNetCDFParser:
             logger.info("=== INSERTING META DATA ===")
             non_empty_fields = {k: v for k, v in meta_data.items() if v and str(v).strip() and str(v) not in ['', 'None', 'nan']}
             logger.info(f"Inserting {len(non_empty_fields)} non-empty fields out of {len(meta_data)} total fields")
-            
-            for key, value in non_empty_fields.items():
-                logger.debug(f"  {key}: {repr(value)}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                for key, value in non_empty_fields.items():
+                    logger.debug("  %s: %r", key, value)
 
             sql = """
             INSERT INTO meta_table (
@@ -1020,6 +1364,10 @@ class UltimateArgoNetCDFParser:
             %(start_date)s, %(start_date_qc)s, %(startup_date)s, %(startup_date_qc)s,
             %(end_mission_date)s, %(end_mission_status)s
             )
+            """
+
+            if update_existing:
+                sql += """
             ON CONFLICT (platform_number) DO UPDATE SET
             data_type = EXCLUDED.data_type,
             format_version = EXCLUDED.format_version,
@@ -1065,18 +1413,21 @@ class UltimateArgoNetCDFParser:
             end_mission_status = EXCLUDED.end_mission_status,
             updated_at = CURRENT_TIMESTAMP
             """
+            else:
+                sql += """
+            ON CONFLICT (platform_number) DO NOTHING
+            """
 
             cursor.execute(sql, meta_data)
-            conn.commit()
-            
-            # ✅ VERIFY: Check what was actually inserted
-            cursor.execute("SELECT * FROM meta_table WHERE platform_number = %s", (meta_data['platform_number'],))
-            inserted_row = cursor.fetchone()
-            if inserted_row:
-                logger.info(f"✅ Successfully updated/inserted meta_table for platform {meta_data['platform_number']}")
-                logger.debug(f"Row in database: {inserted_row}")
-            else:
-                logger.error(f"❌ No row found after insert for platform {meta_data['platform_number']}")
+            self._commit(conn)
+
+            # cursor.rowcount already tells us whether the upsert took
+            # effect; re-SELECTing the row doubled the round-trips for the
+            # metadata path, so only do it when debug logging wants the row
+            logger.info(f"✅ Successfully updated/inserted meta_table for platform {meta_data['platform_number']} (rowcount={cursor.rowcount})")
+            if logger.isEnabledFor(logging.DEBUG):
+                cursor.execute("SELECT * FROM meta_table WHERE platform_number = %s", (meta_data['platform_number'],))
+                logger.debug("Row in database: %s", cursor.fetchone())
 
         except Exception as e:
             conn.rollback()
@@ -1091,113 +1442,301 @@ class UltimateArgoNetCDFParser:
         finally:
             cursor.close()
 
+    # trajectory_depth_table column order shared by the COPY/merge path
+    _TRAJ_DEPTH_COLUMNS = (
+        'trajectory_id', 'platform_number', 'cycle_number',
+        'measurement_code', 'measurement_index',
+        'latitude', 'longitude', 'juld', 'juld_status', 'juld_adjusted',
+        'juld_adjusted_qc', 'juld_adjusted_status',
+        'position_accuracy', 'axes_error_ellipse_major',
+        'axes_error_ellipse_minor', 'axes_error_ellipse_angle',
+        'satellite_name', 'positioning_system', 'position_qc',
+        'pres', 'pres_qc', 'pres_adjusted', 'pres_adjusted_qc', 'pres_adjusted_error',
+        'temp', 'temp_qc', 'temp_adjusted', 'temp_adjusted_qc', 'temp_adjusted_error',
+        'psal', 'psal_qc', 'psal_adjusted', 'psal_adjusted_qc', 'psal_adjusted_error',
+    )
+
+    # Static SQL texts built once at class definition; the insert
+    # methods reference these instead of re-allocating the multi-line
+    # strings on every call
+
+    _SQL_PARAMETER_INSERT = """
+    INSERT INTO parameter_table (
+        platform_number, parameter, parameter_sensor, parameter_units,
+        parameter_accuracy, parameter_resolution, predeployment_calib_equation,
+        coefficient, comment
+    ) VALUES %s
+    ON CONFLICT (platform_number, parameter) DO NOTHING
+    """
+
+    _SQL_FLOAT_UPSERT = """
+    INSERT INTO float_table (platform_number, project_name, wmo_inst_type, positioning_system)
+    VALUES (%(platform_number)s, %(project_name)s, %(wmo_inst_type)s, %(positioning_system)s)
+    ON CONFLICT (platform_number) 
+    DO UPDATE SET
+        project_name = EXCLUDED.project_name,
+        wmo_inst_type = EXCLUDED.wmo_inst_type,
+        positioning_system = EXCLUDED.positioning_system,
+        updated_at = CURRENT_TIMESTAMP
+    """
+
+    _SQL_PROFILE_UPSERT = """
+    INSERT INTO profile_table (
+    platform_number, cycle_number, juld, juld_qc, latitude, longitude,
+    position_qc, direction, data_mode, vertical_sampling_scheme, 
+    config_mission_number, profile_pres_qc, profile_temp_qc, profile_psal_qc
+    ) VALUES %s
+    ON CONFLICT (platform_number, cycle_number, direction) DO UPDATE SET
+    juld = EXCLUDED.juld,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    vertical_sampling_scheme = EXCLUDED.vertical_sampling_scheme,
+    config_mission_number = EXCLUDED.config_mission_number,
+    profile_pres_qc = EXCLUDED.profile_pres_qc,
+    profile_temp_qc = EXCLUDED.profile_temp_qc,
+    profile_psal_qc = EXCLUDED.profile_psal_qc
+    """
+
+    _SQL_CONFIG_UPSERT = """
+    INSERT INTO config_table (
+        platform_number, config_parameter_name, config_parameter_value,
+        config_mission_number, config_mission_comment
+    ) VALUES %s
+    ON CONFLICT (platform_number, config_parameter_name) 
+    DO UPDATE SET
+        config_parameter_value = EXCLUDED.config_parameter_value,
+        config_mission_number = EXCLUDED.config_mission_number,
+        config_mission_comment = EXCLUDED.config_mission_comment,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (config_table.config_parameter_value,
+           config_table.config_mission_number,
+           config_table.config_mission_comment)
+        IS DISTINCT FROM
+          (EXCLUDED.config_parameter_value,
+           EXCLUDED.config_mission_number,
+           EXCLUDED.config_mission_comment)
+    """
+
+    _SQL_LAUNCH_CONFIG_UPSERT = """
+    INSERT INTO launch_config_table (
+        platform_number, launch_config_parameter_name, launch_config_parameter_value
+    ) VALUES %s
+    ON CONFLICT (platform_number, launch_config_parameter_name) 
+    DO UPDATE SET
+        launch_config_parameter_value = EXCLUDED.launch_config_parameter_value,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE launch_config_table.launch_config_parameter_value
+        IS DISTINCT FROM EXCLUDED.launch_config_parameter_value
+    """
+
+    _SQL_SENSOR_UPSERT = """
+    INSERT INTO sensor_table (
+        platform_number, sensor, sensor_maker, sensor_model, sensor_serial_no
+    ) VALUES %s
+    ON CONFLICT (platform_number, sensor) 
+    DO UPDATE SET
+        sensor_maker = EXCLUDED.sensor_maker,
+        sensor_model = EXCLUDED.sensor_model,
+        sensor_serial_no = EXCLUDED.sensor_serial_no,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (sensor_table.sensor_maker,
+           sensor_table.sensor_model,
+           sensor_table.sensor_serial_no)
+        IS DISTINCT FROM
+          (EXCLUDED.sensor_maker,
+           EXCLUDED.sensor_model,
+           EXCLUDED.sensor_serial_no)
+    """
+
+    _SQL_QC_FLAGS_UPSERT = """
+    INSERT INTO qc_flags_table (
+        platform_number, cycle_number, profile_pres_qc,
+        profile_temp_qc, profile_psal_qc, vertical_sampling_scheme
+    ) VALUES %s
+    ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
+        profile_pres_qc = EXCLUDED.profile_pres_qc,
+        profile_temp_qc = EXCLUDED.profile_temp_qc,
+        profile_psal_qc = EXCLUDED.profile_psal_qc,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (qc_flags_table.profile_pres_qc,
+           qc_flags_table.profile_temp_qc,
+           qc_flags_table.profile_psal_qc)
+        IS DISTINCT FROM
+          (EXCLUDED.profile_pres_qc,
+           EXCLUDED.profile_temp_qc,
+           EXCLUDED.profile_psal_qc)
+    """
+
+    _SQL_HISTORY_UPSERT = """
+    INSERT INTO history_table (
+        platform_number, cycle_number, history_institution, history_step,
+        history_software, history_software_release, history_reference, history_date,
+        history_action, history_parameter, history_start_pres, history_stop_pres,
+        history_previous_value, history_qctest
+    ) VALUES %s
+    ON CONFLICT (platform_number, history_institution, history_step, history_date, history_action) 
+    DO UPDATE SET
+        cycle_number = EXCLUDED.cycle_number,
+        history_software = EXCLUDED.history_software,
+        history_software_release = EXCLUDED.history_software_release,
+        history_reference = EXCLUDED.history_reference,
+        history_parameter = EXCLUDED.history_parameter,
+        history_start_pres = EXCLUDED.history_start_pres,
+        history_stop_pres = EXCLUDED.history_stop_pres,
+        history_previous_value = EXCLUDED.history_previous_value,
+        history_qctest = EXCLUDED.history_qctest,
+        created_at = CURRENT_TIMESTAMP
+    """
+
+    _SQL_DATA_MODE_UPSERT = """
+    INSERT INTO data_mode_table (
+        platform_number, cycle_number, data_mode, data_state_indicator,
+        data_centre, dc_reference, date_creation, date_update
+    ) VALUES %s
+    ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
+        data_mode = EXCLUDED.data_mode,
+        data_state_indicator = EXCLUDED.data_state_indicator,
+        date_update = EXCLUDED.date_update,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (data_mode_table.data_mode,
+           data_mode_table.data_state_indicator,
+           data_mode_table.date_update)
+        IS DISTINCT FROM
+          (EXCLUDED.data_mode,
+           EXCLUDED.data_state_indicator,
+           EXCLUDED.date_update)
+    """
+
+    _SQL_BGC_UPSERT = """
+    INSERT INTO bgc_parameters_table (
+        platform_number, parameter_name, parameter_sensor,
+        parameter_units, parameter_accuracy, parameter_resolution
+    ) VALUES %s
+    ON CONFLICT (platform_number, parameter_name) DO UPDATE SET
+        parameter_sensor = EXCLUDED.parameter_sensor,
+        parameter_units = EXCLUDED.parameter_units,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (bgc_parameters_table.parameter_sensor,
+           bgc_parameters_table.parameter_units)
+        IS DISTINCT FROM
+          (EXCLUDED.parameter_sensor,
+           EXCLUDED.parameter_units)
+    """
+
+    _SQL_TRAJECTORY_MERGE = """
+    INSERT INTO trajectory_table ({cols})
+    SELECT {cols} FROM {stage}
+    ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
+        juld_first_location = EXCLUDED.juld_first_location,
+        juld_last_location = EXCLUDED.juld_last_location,
+        juld_first_message = EXCLUDED.juld_first_message,
+        juld_last_message = EXCLUDED.juld_last_message,
+        juld_ascent_start = EXCLUDED.juld_ascent_start,
+        juld_ascent_end = EXCLUDED.juld_ascent_end,
+        juld_descent_start = EXCLUDED.juld_descent_start,
+        juld_descent_end = EXCLUDED.juld_descent_end,
+        juld_park_start = EXCLUDED.juld_park_start,
+        juld_park_end = EXCLUDED.juld_park_end,
+        juld_transmission_start = EXCLUDED.juld_transmission_start,
+        juld_transmission_end = EXCLUDED.juld_transmission_end,
+        first_latitude = EXCLUDED.first_latitude,
+        first_longitude = EXCLUDED.first_longitude,
+        last_latitude = EXCLUDED.last_latitude,
+        last_longitude = EXCLUDED.last_longitude,
+        positioning_system = EXCLUDED.positioning_system,
+        data_mode = EXCLUDED.data_mode,
+        config_mission_number = EXCLUDED.config_mission_number,
+        grounded = EXCLUDED.grounded,
+        representative_park_pressure = EXCLUDED.representative_park_pressure,
+        representative_park_pressure_status = EXCLUDED.representative_park_pressure_status,
+        cycle_number_adjusted = EXCLUDED.cycle_number_adjusted,
+        juld_first_location_status = EXCLUDED.juld_first_location_status,
+        juld_last_location_status = EXCLUDED.juld_last_location_status,
+        juld_first_message_status = EXCLUDED.juld_first_message_status,
+        juld_last_message_status = EXCLUDED.juld_last_message_status,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING trajectory_id, cycle_number
+    """
+
     def insert_trajectory_depth_data(self, traj_depth_data):
-        """Insert into trajectory_depth_table - FIXED with deduplication"""
-        if not traj_depth_data:
+        """Insert into trajectory_depth_table - pandas dedup + COPY merge
+
+        Accepts any iterable of row dicts, including a generator, so the
+        caller never has to hold the full row list in memory.
+        """
+        if traj_depth_data is None:
+            return
+
+        # DataFrame construction consumes the iterable; an empty input
+        # just yields an empty frame
+        df = pd.DataFrame(traj_depth_data)
+        if df.empty:
             return
 
         conn = self.connect_postgres()
         cursor = conn.cursor()
 
         try:
-            trajectory_depth_values = []
-            seen_keys = set()  # ✅ NEW: Track unique combinations
-            duplicates_skipped = 0
-            
-            for traj_depth in traj_depth_data:
-                # ✅ ENHANCED: Double-clean timestamp values with nanosecond removal
-                juld_val = self.clean_timestamp_value_enhanced(traj_depth.get('juld'))
-                juld_adjusted_val = self.clean_timestamp_value_enhanced(traj_depth.get('juld_adjusted'))
-                
-                # ✅ NEW: Create unique key for deduplication
-                unique_key = (
-                    traj_depth['platform_number'],
-                    traj_depth['cycle_number'], 
-                    traj_depth.get('measurement_code'),
-                    juld_val
-                )
-                
-                # ✅ NEW: Skip if we've already seen this combination
-                if unique_key in seen_keys:
-                    duplicates_skipped += 1
-                    logger.debug(f"🔄 Skipping duplicate: {unique_key}")
-                    continue
-                    
-                seen_keys.add(unique_key)
-                
-                trajectory_depth_values.append((
-                    traj_depth.get('trajectory_id'),
-                    traj_depth['platform_number'],
-                    traj_depth['cycle_number'],
-                    # Measurement identification
-                    traj_depth.get('measurement_code'),
-                    traj_depth.get('measurement_index'),
-                    # Position and time - ENHANCED CLEANING
-                    traj_depth.get('latitude'),
-                    traj_depth.get('longitude'),
-                    juld_val,  # ✅ ENHANCED CLEANED
-                    traj_depth.get('juld_status'),
-                    juld_adjusted_val,  # ✅ ENHANCED CLEANED
-                    traj_depth.get('juld_adjusted_qc'),
-                    traj_depth.get('juld_adjusted_status'),
-                    # Position details
-                    traj_depth.get('position_accuracy'),
-                    traj_depth.get('axes_error_ellipse_major'),
-                    traj_depth.get('axes_error_ellipse_minor'),
-                    traj_depth.get('axes_error_ellipse_angle'),
-                    traj_depth.get('satellite_name'),
-                    traj_depth.get('positioning_system'),
-                    traj_depth.get('position_qc'),
-                    # Measurements
-                    traj_depth.get('pres'),
-                    traj_depth.get('pres_qc'),
-                    traj_depth.get('pres_adjusted'),
-                    traj_depth.get('pres_adjusted_qc'),
-                    traj_depth.get('pres_adjusted_error'),
-                    traj_depth.get('temp'),
-                    traj_depth.get('temp_qc'),
-                    traj_depth.get('temp_adjusted'),
-                    traj_depth.get('temp_adjusted_qc'),
-                    traj_depth.get('temp_adjusted_error'),
-                    traj_depth.get('psal'),
-                    traj_depth.get('psal_qc'),
-                    traj_depth.get('psal_adjusted'),
-                    traj_depth.get('psal_adjusted_qc'),
-                    traj_depth.get('psal_adjusted_error')
-                ))
-
-            # ✅ LOG: Show deduplication results
+            # Make sure every expected column exists even if no row set it
+            for col in self._TRAJ_DEPTH_COLUMNS:
+                if col not in df.columns:
+                    df[col] = None
+
+            # ✅ ENHANCED: Double-clean timestamp values with nanosecond removal
+            df['juld'] = self.clean_timestamps_vectorized(df['juld'])
+            df['juld_adjusted'] = self.clean_timestamps_vectorized(df['juld_adjusted'])
+
+            # Integer columns pick up float dtype when rows have gaps;
+            # nullable Int64 keeps them integral in the CSV stream
+            for col in ('trajectory_id', 'cycle_number', 'measurement_code', 'measurement_index'):
+                df[col] = df[col].astype('Int64')
+
+            # Dedup on the table's unique key in pandas' C hash table
+            # instead of a per-row Python set of tuples
+            before = len(df)
+            df = df.drop_duplicates(
+                subset=['platform_number', 'cycle_number', 'measurement_code', 'juld'],
+                keep='first'
+            )
+            duplicates_skipped = before - len(df)
             if duplicates_skipped > 0:
                 logger.info(f"🔄 Removed {duplicates_skipped} duplicate rows from batch")
-            
-            logger.info(f"✅ Processing {len(trajectory_depth_values)} unique trajectory depth records")
 
-            if not trajectory_depth_values:
+            logger.info(f"✅ Processing {len(df)} unique trajectory depth records")
+
+            if df.empty:
                 logger.warning("⚠️ No unique records to insert after deduplication")
                 return
 
-            # ✅ SIMPLIFIED: Use DO NOTHING instead of DO UPDATE to avoid conflicts
-            sql = """
-            INSERT INTO trajectory_depth_table (
-                trajectory_id, platform_number, cycle_number,
-                measurement_code, measurement_index,
-                latitude, longitude, juld, juld_status, juld_adjusted, juld_adjusted_qc, juld_adjusted_status,
-                position_accuracy, axes_error_ellipse_major, axes_error_ellipse_minor, axes_error_ellipse_angle,
-                satellite_name, positioning_system, position_qc,
-                pres, pres_qc, pres_adjusted, pres_adjusted_qc, pres_adjusted_error,
-                temp, temp_qc, temp_adjusted, temp_adjusted_qc, temp_adjusted_error,
-                psal, psal_qc, psal_adjusted, psal_adjusted_qc, psal_adjusted_error
-            ) VALUES %s
-            ON CONFLICT (platform_number, cycle_number, measurement_code, juld) 
-            DO NOTHING
-            """
+            # COPY into a temp staging table, then a single INSERT ... ON
+            # CONFLICT DO NOTHING merge keeps the re-ingest semantics of
+            # the old execute_values path
+            import io
+
+            cols = ', '.join(self._TRAJ_DEPTH_COLUMNS)
+            cursor.execute("""
+                CREATE TEMP TABLE traj_depth_stage
+                (LIKE trajectory_depth_table INCLUDING DEFAULTS)
+                ON COMMIT DROP
+            """)
+
+            buf = io.StringIO()
+            df.to_csv(buf, columns=list(self._TRAJ_DEPTH_COLUMNS), header=False, index=False)
+            buf.seek(0)
+            cursor.copy_expert(
+                f"COPY traj_depth_stage ({cols}) FROM STDIN WITH (FORMAT csv)",
+                buf
+            )
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, trajectory_depth_values, template=None, page_size=100)
-            conn.commit()
-            
-            inserted_count = len(trajectory_depth_values)
-            logger.info(f"✅ Successfully processed {inserted_count} unique trajectory depth measurements")
+            cursor.execute(f"""
+                INSERT INTO trajectory_depth_table ({cols})
+                SELECT {cols} FROM traj_depth_stage
+                ON CONFLICT (platform_number, cycle_number, measurement_code, juld)
+                DO NOTHING
+            """)
+            self._commit(conn)
+
+            logger.info(f"✅ Successfully processed {len(df)} unique trajectory depth measurements")
             if duplicates_skipped > 0:
                 logger.info(f"🔄 Skipped {duplicates_skipped} duplicates in current batch")
 
@@ -1206,8 +1745,9 @@ class UltimateArgoNetCDFParser:
             logger.error(f"❌ Error inserting trajectory depth data: {e}")
             raise
         finally:
+            # The connection is the shared pooled one - only the cursor is
+            # per-call state
             cursor.close()
-            conn.close()
 
     def clean_timestamp_value_enhanced(self, timestamp_val):
         """✅ Enhanced timestamp cleaning with nanosecond removal"""
@@ -1232,9 +1772,22 @@ class UltimateArgoNetCDFParser:
             return None
             
         except Exception as e:
-            logger.warning(f"⚠️ Timestamp conversion failed for {timestamp_val}: {e}")
+            logger.warning("⚠️ Timestamp conversion failed for %s: %s", timestamp_val, e)
             return None
 
+    def clean_timestamps_vectorized(self, values):
+        """Vectorized clean_timestamp_value_enhanced for whole columns
+
+        One pd.to_datetime pass over the array replaces a Python call per
+        row; unparseable entries coerce to None instead of raising.
+        """
+        try:
+            cleaned = pd.to_datetime(pd.Series(values), errors='coerce').dt.round('ms')
+            return cleaned.astype(object).where(cleaned.notna(), None)
+        except Exception as e:
+            logger.warning(f"⚠️ Vectorized timestamp conversion failed, falling back per-value: {e}")
+            return pd.Series(values).map(self.clean_timestamp_value_enhanced)
+
 
 
     def insert_config_data(self, config_data_list):
@@ -1246,6 +1799,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            config_data_list = list({(c['platform_number'], c['config_parameter_name']): c for c in config_data_list}.values())
+
             config_values = []
             for config in config_data_list:
                 config_values.append((
@@ -1257,22 +1814,10 @@ class UltimateArgoNetCDFParser:
                 ))
 
             # ✅ INSERT with ON CONFLICT to prevent duplicates
-            sql = """
-            INSERT INTO config_table (
-                platform_number, config_parameter_name, config_parameter_value,
-                config_mission_number, config_mission_comment
-            ) VALUES %s
-            ON CONFLICT (platform_number, config_parameter_name) 
-            DO UPDATE SET
-                config_parameter_value = EXCLUDED.config_parameter_value,
-                config_mission_number = EXCLUDED.config_mission_number,
-                config_mission_comment = EXCLUDED.config_mission_comment,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_CONFIG_UPSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, config_values)
-            conn.commit()
+            execute_values(cursor, sql, config_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"✅ Updated config_table: {len(config_data_list)} config parameters")
 
         except Exception as e:
@@ -1297,6 +1842,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            launch_config_data_list = list({(c['platform_number'], c['launch_config_parameter_name']): c for c in launch_config_data_list}.values())
+
             launch_config_values = []
             for config in launch_config_data_list:
                 launch_config_values.append((
@@ -1306,19 +1855,10 @@ class UltimateArgoNetCDFParser:
                 ))
 
             # ✅ INSERT with ON CONFLICT to prevent duplicates
-            sql = """
-            INSERT INTO launch_config_table (
-                platform_number, launch_config_parameter_name, launch_config_parameter_value
-            ) VALUES %s
-            ON CONFLICT (platform_number, launch_config_parameter_name) 
-            DO UPDATE SET
-                launch_config_parameter_value = EXCLUDED.launch_config_parameter_value,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_LAUNCH_CONFIG_UPSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, launch_config_values)
-            conn.commit()
+            execute_values(cursor, sql, launch_config_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"✅ Updated launch_config_table: {len(launch_config_data_list)} launch config parameters")
 
         except Exception as e:
@@ -1343,6 +1883,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            sensor_data_list = list({(s['platform_number'], s['sensor']): s for s in sensor_data_list}.values())
+
             sensor_values = []
             for sensor in sensor_data_list:
                 sensor_values.append((
@@ -1354,21 +1898,10 @@ class UltimateArgoNetCDFParser:
                 ))
 
             # ✅ INSERT with ON CONFLICT to prevent duplicates
-            sql = """
-            INSERT INTO sensor_table (
-                platform_number, sensor, sensor_maker, sensor_model, sensor_serial_no
-            ) VALUES %s
-            ON CONFLICT (platform_number, sensor) 
-            DO UPDATE SET
-                sensor_maker = EXCLUDED.sensor_maker,
-                sensor_model = EXCLUDED.sensor_model,
-                sensor_serial_no = EXCLUDED.sensor_serial_no,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_SENSOR_UPSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, sensor_values)
-            conn.commit()
+            execute_values(cursor, sql, sensor_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"✅ Updated sensor_table: {len(sensor_data_list)} sensors")
 
         except Exception as e:
@@ -1393,6 +1926,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            qc_data_list = list({(q['platform_number'], q.get('cycle_number')): q for q in qc_data_list}.values())
+
             qc_values = []
             for qc in qc_data_list:
                 qc_values.append((
@@ -1404,20 +1941,10 @@ class UltimateArgoNetCDFParser:
                     qc['vertical_sampling_scheme']
                 ))
 
-            sql = """
-            INSERT INTO qc_flags_table (
-                platform_number, cycle_number, profile_pres_qc,
-                profile_temp_qc, profile_psal_qc, vertical_sampling_scheme
-            ) VALUES %s
-            ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
-                profile_pres_qc = EXCLUDED.profile_pres_qc,
-                profile_temp_qc = EXCLUDED.profile_temp_qc,
-                profile_psal_qc = EXCLUDED.profile_psal_qc,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_QC_FLAGS_UPSERT
 
-            execute_values(cursor, sql, qc_values)
-            conn.commit()
+            execute_values(cursor, sql, qc_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"Updated qc_flags_table: {len(qc_data_list)} QC records")
 
         except Exception as e:
@@ -1427,15 +1954,59 @@ class UltimateArgoNetCDFParser:
         finally:
             cursor.close()
 
+    def ensure_schema(self):
+        """One-time schema fixups, safe to call from any number of processes
+
+        Runs the constraint DDL once per parser under an advisory lock so
+        concurrent ingest workers never race on ALTER TABLE (which takes an
+        ACCESS EXCLUSIVE lock on history_table). Keeping this out of the
+        insert path means history batches never pay a DDL attempt.
+        """
+        if self._history_constraint_checked:
+            return
+
+        conn = self.connect_postgres()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                DO $$
+                BEGIN
+                    PERFORM pg_advisory_xact_lock(hashtext('argo_schema_init'));
+                    IF NOT EXISTS (
+                        SELECT 1 FROM pg_constraint
+                        WHERE conname = 'unique_history_record'
+                    ) THEN
+                        ALTER TABLE history_table
+                        ADD CONSTRAINT unique_history_record
+                        UNIQUE (platform_number, history_institution, history_step, history_date, history_action);
+                    END IF;
+                END
+                $$
+            """)
+            self._commit(conn)
+            self._history_constraint_checked = True
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error ensuring schema: {e}")
+            raise
+        finally:
+            cursor.close()
+
     def insert_history_data(self, history_data_list):
         """Insert into history_table with duplicate prevention - Updated for new schema"""
         if not history_data_list:
             return
 
+        self.ensure_schema()
+
         conn = self.connect_postgres()
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            history_data_list = list({(h['platform_number'], h['history_institution'], h['history_step'], h['history_date'], h['history_action']): h for h in history_data_list}.values())
+
             history_values = []
             for history in history_data_list:
                 history_values.append((
@@ -1455,44 +2026,11 @@ class UltimateArgoNetCDFParser:
                     history['history_qctest']
                 ))
 
-            # Add unique constraint if not exists
-            try:
-                cursor.execute("""
-                    ALTER TABLE history_table 
-                    ADD CONSTRAINT unique_history_record 
-                    UNIQUE (platform_number, history_institution, history_step, history_date, history_action)
-                """)
-                conn.commit()
-                logger.info("Added unique constraint to history_table")
-            except Exception:
-                # Constraint already exists, ignore
-                conn.rollback()
-
             # ✅ INSERT with ON CONFLICT to prevent duplicates
-            sql = """
-            INSERT INTO history_table (
-                platform_number, cycle_number, history_institution, history_step,
-                history_software, history_software_release, history_reference, history_date,
-                history_action, history_parameter, history_start_pres, history_stop_pres,
-                history_previous_value, history_qctest
-            ) VALUES %s
-            ON CONFLICT (platform_number, history_institution, history_step, history_date, history_action) 
-            DO UPDATE SET
-                cycle_number = EXCLUDED.cycle_number,
-                history_software = EXCLUDED.history_software,
-                history_software_release = EXCLUDED.history_software_release,
-                history_reference = EXCLUDED.history_reference,
-                history_parameter = EXCLUDED.history_parameter,
-                history_start_pres = EXCLUDED.history_start_pres,
-                history_stop_pres = EXCLUDED.history_stop_pres,
-                history_previous_value = EXCLUDED.history_previous_value,
-                history_qctest = EXCLUDED.history_qctest,
-                created_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_HISTORY_UPSERT
 
-            from psycopg2.extras import execute_values
-            execute_values(cursor, sql, history_values)
-            conn.commit()
+            execute_values(cursor, sql, history_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"✅ Updated history_table: {len(history_data_list)} history records")
 
         except Exception as e:
@@ -1517,6 +2055,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            data_mode_data_list = list({(d['platform_number'], d.get('cycle_number')): d for d in data_mode_data_list}.values())
+
             data_mode_values = []
             for data_mode in data_mode_data_list:
                 data_mode_values.append((
@@ -1530,20 +2072,10 @@ class UltimateArgoNetCDFParser:
                     data_mode['date_update']
                 ))
 
-            sql = """
-            INSERT INTO data_mode_table (
-                platform_number, cycle_number, data_mode, data_state_indicator,
-                data_centre, dc_reference, date_creation, date_update
-            ) VALUES %s
-            ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
-                data_mode = EXCLUDED.data_mode,
-                data_state_indicator = EXCLUDED.data_state_indicator,
-                date_update = EXCLUDED.date_update,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_DATA_MODE_UPSERT
 
-            execute_values(cursor, sql, data_mode_values)
-            conn.commit()
+            execute_values(cursor, sql, data_mode_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"Updated data_mode_table: {len(data_mode_data_list)} data mode records")
 
         except Exception as e:
@@ -1562,6 +2094,10 @@ class UltimateArgoNetCDFParser:
         cursor = conn.cursor()
 
         try:
+            # Keep the last occurrence per conflict key so the server
+            # never has to resolve duplicates from the same batch
+            bgc_data_list = list({(b['platform_number'], b['parameter_name']): b for b in bgc_data_list}.values())
+
             bgc_values = []
             for bgc in bgc_data_list:
                 bgc_values.append((
@@ -1573,19 +2109,10 @@ class UltimateArgoNetCDFParser:
                     bgc['parameter_resolution']
                 ))
 
-            sql = """
-            INSERT INTO bgc_parameters_table (
-                platform_number, parameter_name, parameter_sensor,
-                parameter_units, parameter_accuracy, parameter_resolution
-            ) VALUES %s
-            ON CONFLICT (platform_number, parameter_name) DO UPDATE SET
-                parameter_sensor = EXCLUDED.parameter_sensor,
-                parameter_units = EXCLUDED.parameter_units,
-                updated_at = CURRENT_TIMESTAMP
-            """
+            sql = self._SQL_BGC_UPSERT
 
-            execute_values(cursor, sql, bgc_values)
-            conn.commit()
+            execute_values(cursor, sql, bgc_values, page_size=EXECUTE_VALUES_PAGE_SIZE)
+            self._commit(conn)
             logger.info(f"Updated bgc_parameters_table: {len(bgc_data_list)} BGC parameters")
 
         except Exception as e:
@@ -1623,49 +2150,121 @@ class UltimateArgoNetCDFParser:
                 return decoded
                 
         except Exception as e:
-            logger.warning(f"Error extracting {var_name}[{cycle_idx}]: {e}")
+            logger.warning("Error extracting %s[%s]: %s", var_name, cycle_idx, e)
+            return default
+
+    def preload_cycle_vars(self, ds, var_names):
+        """Materialize each cycle-level variable once for the whole file
+
+        ds[var].values re-reads the full array from the NetCDF backend, so
+        calling it per (cycle, variable) costs O(cycles x vars) array
+        materializations. This reads each variable exactly once; numeric
+        and datetime JULD columns are additionally converted to datetimes
+        in a single vectorized pass (char JULD_*_STATUS columns keep the
+        scalar path).
+        """
+        preloaded = {}
+        for name in var_names:
+            if name not in ds:
+                preloaded[name] = None
+                continue
+            values = ds[name].values
+            if 'JULD' in name and values.ndim >= 1 and values.dtype.kind in ('f', 'i', 'M'):
+                values = np.asarray(self.bulk_julian_to_datetime(values), dtype=object)
+            preloaded[name] = values
+        return preloaded
+
+    def safe_get_cycle_var_prealloc(self, preloaded, var_name, cycle_idx, default=None):
+        """safe_get_cycle_var against arrays from preload_cycle_vars"""
+        var_values = preloaded.get(var_name)
+        if var_values is None:
+            return default
+
+        try:
+            if var_values.ndim == 0:
+                raw_val = var_values.item()
+            elif cycle_idx < len(var_values):
+                raw_val = var_values[cycle_idx]
+            else:
+                return default
+
+            # Handle JULD variables specially
+            if 'JULD' in var_name:
+                if var_values.dtype == object:
+                    # Already converted in bulk during preload
+                    return raw_val
+                return self.enhanced_julian_to_datetime(raw_val)
+            else:
+                # For non-date fields, decode safely
+                decoded = self.safe_decode(raw_val)
+                # Return None for 'nan' strings
+                if decoded and decoded.lower() in ['nan', 'nat', '']:
+                    return None
+                return decoded
+
+        except Exception as e:
+            logger.warning("Error extracting %s[%s]: %s", var_name, cycle_idx, e)
             return default
 
+    def _copy_upsert(self, cursor, table, columns, rows, merge_sql):
+        """Stage rows via COPY and merge them with a single statement
+
+        COPY removes per-row SQL parsing on the server; the merge
+        statement (INSERT ... SELECT ... ON CONFLICT ...) then runs once
+        per batch. merge_sql is formatted with the staging table name and
+        the shared column list.
+        """
+        import csv
+        import io
+
+        stage = f"stg_{table}"
+        cols = ', '.join(columns)
+
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(f"TRUNCATE {stage}")
+
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        cursor.copy_expert(f"COPY {stage} ({cols}) FROM STDIN WITH (FORMAT csv)", buf)
+
+        cursor.execute(merge_sql.format(stage=stage, cols=cols))
+
     def insert_trajectory_data(self, trajectories, batch_size=1000):
-        """Insert into trajectory_table - Updated for new schema with full UPDATE"""
-        if not trajectories:
-            return
+        """Insert into trajectory_table - Updated for new schema with full UPDATE
+
+        Accepts any iterable of trajectory dicts; batches of batch_size are
+        pulled with itertools.islice so a generator upstream never has to
+        materialize the whole file's cycles at once.
 
+        Returns the {cycle_number: trajectory_id} mapping collected from
+        the merge's RETURNING clause, saving callers the follow-up SELECT.
+        """
         conn = self.connect_postgres()
         cursor = conn.cursor()
 
         try:
             total_inserted = 0
             total_skipped = 0
-            
-            # Helper functions for data truncation
-            def safe_char_1(value):
-                """Ensure value fits in CHAR(1)"""
-                if value is None:
-                    return None
-                str_val = str(value).strip()
-                if str_val.lower() == 'nan':
-                    return None
-                return str_val[:1] if str_val else None
-            
-            def safe_varchar_50(value):
-                """Ensure value fits in VARCHAR(50)"""
-                if value is None:
-                    return None
-                str_val = str(value).strip()
-                return str_val[:50] if str_val else None
-            
-            for i in range(0, len(trajectories), batch_size):
-                batch = trajectories[i:i+batch_size]
-                trajectory_values = []
-                
-                for traj in batch:
-                    if not traj.get('platform_number'):
-                        total_skipped += 1
-                        continue
-                    
-                    # Match your NEW schema columns
-                    trajectory_values.append((
+            trajectory_ids = {}
+
+            it = iter(trajectories)
+            while True:
+                batch = list(itertools.islice(it, batch_size))
+                if not batch:
+                    break
+
+                valid = [traj for traj in batch if traj.get('platform_number')]
+                total_skipped += len(batch) - len(valid)
+                # Last write wins within the batch, matching the DO UPDATE merge
+                valid = list({(t['platform_number'], t.get('cycle_number')): t for t in valid}.values())
+
+                # Single comprehension in schema column order; truncation goes
+                # through the module-level helpers instead of per-call closures
+                trajectory_values = [
+                    (
                         traj['platform_number'],
                         traj.get('cycle_number'),
                         # Cycle timing summary fields
@@ -1687,74 +2286,58 @@ class UltimateArgoNetCDFParser:
                         traj.get('last_latitude'),
                         traj.get('last_longitude'),
                         # Metadata
-                        safe_varchar_50(traj.get('positioning_system')),
-                        safe_char_1(traj.get('data_mode', 'R')),
+                        _safe_varchar_50(traj.get('positioning_system')),
+                        _safe_char_1(traj.get('data_mode', 'R')),
                         traj.get('config_mission_number'),
-                        safe_char_1(traj.get('grounded')),
+                        _safe_char_1(traj.get('grounded')),
                         # Representative measurements
                         traj.get('representative_park_pressure'),
-                        safe_char_1(traj.get('representative_park_pressure_status')),
+                        _safe_char_1(traj.get('representative_park_pressure_status')),
                         # Adjustments
                         traj.get('cycle_number_adjusted'),
                         # Status fields
-                        safe_char_1(traj.get('juld_first_location_status')),
-                        safe_char_1(traj.get('juld_last_location_status')),
-                        safe_char_1(traj.get('juld_first_message_status')),
-                        safe_char_1(traj.get('juld_last_message_status'))
-                    ))
+                        _safe_char_1(traj.get('juld_first_location_status')),
+                        _safe_char_1(traj.get('juld_last_location_status')),
+                        _safe_char_1(traj.get('juld_first_message_status')),
+                        _safe_char_1(traj.get('juld_last_message_status'))
+                    )
+                    for traj in valid
+                ]
+
+                if not trajectory_values:
+                    continue
 
-                if trajectory_values:
-                    sql = """
-                    INSERT INTO trajectory_table (
-                        platform_number, cycle_number,
-                        juld_first_location, juld_last_location, juld_first_message, juld_last_message,
-                        juld_ascent_start, juld_ascent_end, juld_descent_start, juld_descent_end,
-                        juld_park_start, juld_park_end, juld_transmission_start, juld_transmission_end,
-                        first_latitude, first_longitude, last_latitude, last_longitude,
-                        positioning_system, data_mode, config_mission_number, grounded,
-                        representative_park_pressure, representative_park_pressure_status,
-                        cycle_number_adjusted,
-                        juld_first_location_status, juld_last_location_status,
-                        juld_first_message_status, juld_last_message_status
-                    ) VALUES %s
-                    ON CONFLICT (platform_number, cycle_number) DO UPDATE SET
-                        juld_first_location = EXCLUDED.juld_first_location,
-                        juld_last_location = EXCLUDED.juld_last_location,
-                        juld_first_message = EXCLUDED.juld_first_message,
-                        juld_last_message = EXCLUDED.juld_last_message,
-                        juld_ascent_start = EXCLUDED.juld_ascent_start,
-                        juld_ascent_end = EXCLUDED.juld_ascent_end,
-                        juld_descent_start = EXCLUDED.juld_descent_start,
-                        juld_descent_end = EXCLUDED.juld_descent_end,
-                        juld_park_start = EXCLUDED.juld_park_start,
-                        juld_park_end = EXCLUDED.juld_park_end,
-                        juld_transmission_start = EXCLUDED.juld_transmission_start,
-                        juld_transmission_end = EXCLUDED.juld_transmission_end,
-                        first_latitude = EXCLUDED.first_latitude,
-                        first_longitude = EXCLUDED.first_longitude,
-                        last_latitude = EXCLUDED.last_latitude,
-                        last_longitude = EXCLUDED.last_longitude,
-                        positioning_system = EXCLUDED.positioning_system,
-                        data_mode = EXCLUDED.data_mode,
-                        config_mission_number = EXCLUDED.config_mission_number,
-                        grounded = EXCLUDED.grounded,
-                        representative_park_pressure = EXCLUDED.representative_park_pressure,
-                        representative_park_pressure_status = EXCLUDED.representative_park_pressure_status,
-                        cycle_number_adjusted = EXCLUDED.cycle_number_adjusted,
-                        juld_first_location_status = EXCLUDED.juld_first_location_status,
-                        juld_last_location_status = EXCLUDED.juld_last_location_status,
-                        juld_first_message_status = EXCLUDED.juld_first_message_status,
-                        juld_last_message_status = EXCLUDED.juld_last_message_status,
-                        updated_at = CURRENT_TIMESTAMP
-                    """
-
-                    from psycopg2.extras import execute_values
-                    execute_values(cursor, sql, trajectory_values, template=None, page_size=100)
-                    conn.commit()
-                    logger.info(f"✅ Updated trajectory_table: batch of {len(trajectory_values)} trajectory cycles")
-                    total_inserted += len(trajectory_values)
+                merge_sql = self._SQL_TRAJECTORY_MERGE
+
+                self._copy_upsert(
+                    cursor,
+                    'trajectory_table',
+                    (
+                        'platform_number', 'cycle_number',
+                        'juld_first_location', 'juld_last_location',
+                        'juld_first_message', 'juld_last_message',
+                        'juld_ascent_start', 'juld_ascent_end',
+                        'juld_descent_start', 'juld_descent_end',
+                        'juld_park_start', 'juld_park_end',
+                        'juld_transmission_start', 'juld_transmission_end',
+                        'first_latitude', 'first_longitude', 'last_latitude', 'last_longitude',
+                        'positioning_system', 'data_mode', 'config_mission_number', 'grounded',
+                        'representative_park_pressure', 'representative_park_pressure_status',
+                        'cycle_number_adjusted',
+                        'juld_first_location_status', 'juld_last_location_status',
+                        'juld_first_message_status', 'juld_last_message_status',
+                    ),
+                    trajectory_values,
+                    merge_sql
+                )
+                for traj_id, cycle in cursor.fetchall():
+                    trajectory_ids[cycle] = traj_id
+                self._commit(conn)
+                logger.info(f"✅ Updated trajectory_table: {len(trajectory_values)} trajectory cycles via COPY")
+                total_inserted += len(trajectory_values)
 
             logger.info(f"🎯 TRAJECTORY SUCCESS: {total_inserted} inserted, {total_skipped} skipped")
+            return trajectory_ids
 
         except Exception as e:
             conn.rollback()
@@ -1849,14 +2432,46 @@ class UltimateArgoNetCDFParser:
         }
 
     
+    # Scalar meta_table fields stored as NetCDF variables; decoded in a
+    # single pass per meta file
+    _META_SCALAR_VARS = frozenset({
+        'DATA_TYPE', 'FORMAT_VERSION', 'HANDBOOK_VERSION',
+        'DATE_CREATION', 'DATE_UPDATE', 'PTT',
+        'PLATFORM_FAMILY', 'PLATFORM_TYPE', 'PLATFORM_MAKER',
+        'FIRMWARE_VERSION', 'MANUAL_VERSION', 'FLOAT_SERIAL_NO',
+        'DAC_FORMAT_ID', 'WMO_INST_TYPE', 'PROJECT_NAME',
+        'DATA_CENTRE', 'PI_NAME', 'ANOMALY',
+        'BATTERY_TYPE', 'BATTERY_PACKS',
+        'CONTROLLER_BOARD_TYPE_PRIMARY', 'CONTROLLER_BOARD_TYPE_SECONDARY',
+        'CONTROLLER_BOARD_SERIAL_NO_PRIMARY', 'CONTROLLER_BOARD_SERIAL_NO_SECONDARY',
+        'SPECIAL_FEATURES', 'FLOAT_OWNER', 'OPERATING_INSTITUTION',
+        'CUSTOMISATION', 'LAUNCH_DATE', 'LAUNCH_LATITUDE', 'LAUNCH_LONGITUDE',
+        'LAUNCH_QC', 'START_DATE', 'START_DATE_QC',
+        'STARTUP_DATE', 'STARTUP_DATE_QC',
+        'END_MISSION_DATE', 'END_MISSION_STATUS',
+    })
+
     def process_meta_file(self, filepath):
         """Process meta.nc file - Complete meta extraction and insertion"""
         logger.info(f"Processing meta file: {filepath}")
 
         try:
-            ds = xr.open_dataset(filepath)
+            # Meta files carry their dates as character variables, so CF
+            # time decoding is pure overhead here; cache=False skips
+            # keeping decoded copies alive for a single-pass read
+            ds = xr.open_dataset(
+                filepath,
+                cache=False,
+                decode_times=False,
+                decode_timedelta=False,
+            )
             logger.info(f"Successfully opened meta file: {filepath}")
 
+            # Snapshot variable membership once; xarray's Frozen mapping
+            # __contains__ is much slower than a frozenset probe and these
+            # checks repeat across every section below
+            var_names = frozenset(ds.variables)
+
             # Extract platform number
             platform_values = ds['PLATFORM_NUMBER'].values
             if platform_values.ndim == 0:
@@ -1866,31 +2481,53 @@ class UltimateArgoNetCDFParser:
 
             logger.info(f"Meta file platform number: {platform_number}")
 
-            # ✅ Helper function for scalar variables (THE KEY FIX!)
-            def get_scalar_variable(var_name, default=''):
-                """Get value from scalar variable"""
+            # ✅ Decode every wanted scalar variable in ONE pass over
+            # ds.variables instead of a ds[...] lookup (and DataArray
+            # construction) per field
+            scalar_cache = {}
+            for name, var in ds.variables.items():
+                if name not in self._META_SCALAR_VARS:
+                    continue
                 try:
-                    if var_name in ds.variables:
-                        values = ds[var_name].values
-                        if hasattr(values, 'item'):
-                            # It's a scalar numpy value
-                            result = self.safe_decode(values.item())
-                            logger.debug(f"Scalar {var_name} = '{result}'")
-                            return result
-                        elif hasattr(values, '__len__') and len(values) > 0:
-                            # It's an array with values
-                            result = self.safe_decode(values[0])
-                            logger.debug(f"Array {var_name}[0] = '{result}'")
-                            return result
-                        else:
-                            # Try to decode directly
-                            result = self.safe_decode(values)
-                            logger.debug(f"Direct {var_name} = '{result}'")
-                            return result
-                    return default
+                    values = var.values
+                    if values.size == 1:
+                        scalar_cache[name] = self.safe_decode(values.item())
+                    # Multi-element variables fall through to the default,
+                    # matching the old per-field extractor
                 except Exception as e:
-                    logger.debug(f"Error getting {var_name}: {e}")
-                    return default
+                    logger.debug("Error getting %s: %s", name, e)
+
+            def get_scalar_variable(var_name, default=''):
+                """Get value from the single-pass scalar cache"""
+                return scalar_cache.get(var_name, default)
+
+            def first_array_value(var_name):
+                """First element of a 1-D array variable, reading it once"""
+                if var_name not in var_names:
+                    return ''
+                values = ds[var_name].values
+                return self.safe_decode(values[0]) if len(values) > 0 else ''
+
+            def load_column(name):
+                """Materialize a variable's array once for loop indexing
+
+                Character columns are decoded in one vectorized pass so
+                per-row access is a plain string index.
+                """
+                if name not in var_names:
+                    return None
+                col = ds[name].values
+                decoded = self._decode_col(col)
+                return col if decoded is None else decoded
+
+            def column_at(col, idx, default=''):
+                """Decode col[idx] with bounds/missing-column handling"""
+                if col is not None and idx < len(col):
+                    value = col[idx]
+                    if isinstance(value, str):
+                        return value
+                    return self.safe_decode(value)
+                return default
 
             # ✅ COMPLETE meta data extraction using VARIABLES (not attributes!)
             def get_battery_packs():
@@ -1898,24 +2535,13 @@ class UltimateArgoNetCDFParser:
                 try:
                     battery_text = get_scalar_variable('BATTERY_PACKS')
                     if battery_text:
-                        # Extract number from text like "board -  1 (s/n: 41);"
-                        import re
-                        # Look for patterns like "- 1" or "- 2" etc.
-                        match = re.search(r'-\s*(\d+)', battery_text)
-                        if match:
-                            result = int(match.group(1))
-                            logger.debug(f"Extracted battery_packs: {result} from '{battery_text}'")
+                        result = _parse_battery_packs(battery_text)
+                        if result is not None:
+                            logger.debug("Extracted battery_packs: %s from '%s'", result, battery_text)
                             return result
-                        else:
-                            # Try to find any number in the text
-                            numbers = re.findall(r'\d+', battery_text)
-                            if numbers:
-                                result = int(numbers[0])  # Take first number found
-                                logger.debug(f"Found battery_packs: {result} from '{battery_text}'")
-                                return result
                     return None
                 except Exception as e:
-                    logger.debug(f"Error parsing battery_packs: {e}")
+                    logger.debug("Error parsing battery_packs: %s", e)
                     return None
 
         # ✅ COMPLETE meta data extraction using VARIABLES (not attributes!)
@@ -1954,32 +2580,36 @@ class UltimateArgoNetCDFParser:
                 'launch_date': self.argo_date_to_datetime(get_scalar_variable('LAUNCH_DATE')),
                 'launch_latitude': self.safe_float(get_scalar_variable('LAUNCH_LATITUDE')),
                 'launch_longitude': self.safe_float(get_scalar_variable('LAUNCH_LONGITUDE')),
-                'launch_qc': get_scalar_variable('LAUNCH_QC')[:1] if get_scalar_variable('LAUNCH_QC') else '',
+                'launch_qc': (get_scalar_variable('LAUNCH_QC') or '')[:1],
                 'start_date': self.argo_date_to_datetime(get_scalar_variable('START_DATE')),
-                'start_date_qc': get_scalar_variable('START_DATE_QC')[:1] if get_scalar_variable('START_DATE_QC') else '',
+                'start_date_qc': (get_scalar_variable('START_DATE_QC') or '')[:1],
                 'startup_date': self.argo_date_to_datetime(get_scalar_variable('STARTUP_DATE')),
-                'startup_date_qc': get_scalar_variable('STARTUP_DATE_QC')[:1] if get_scalar_variable('STARTUP_DATE_QC') else '',
+                'startup_date_qc': (get_scalar_variable('STARTUP_DATE_QC') or '')[:1],
                 'end_mission_date': self.argo_date_to_datetime(get_scalar_variable('END_MISSION_DATE')),
                 'end_mission_status': get_scalar_variable('END_MISSION_STATUS'),
                 
-                # Array variables (these work as before)
-                'trans_system': self.safe_decode(ds['TRANS_SYSTEM'].values[0]) if 'TRANS_SYSTEM' in ds.variables and len(ds['TRANS_SYSTEM'].values) > 0 else '',
-                'trans_system_id': self.safe_decode(ds['TRANS_SYSTEM_ID'].values[0]) if 'TRANS_SYSTEM_ID' in ds.variables and len(ds['TRANS_SYSTEM_ID'].values) > 0 else '',
-                'trans_frequency': self.safe_decode(ds['TRANS_FREQUENCY'].values[0]) if 'TRANS_FREQUENCY' in ds.variables and len(ds['TRANS_FREQUENCY'].values) > 0 else '',
-                'positioning_system': self.safe_decode(ds['POSITIONING_SYSTEM'].values[0]) if 'POSITIONING_SYSTEM' in ds.variables and len(ds['POSITIONING_SYSTEM'].values) > 0 else '',
+                # Array variables (each read once)
+                'trans_system': first_array_value('TRANS_SYSTEM'),
+                'trans_system_id': first_array_value('TRANS_SYSTEM_ID'),
+                'trans_frequency': first_array_value('TRANS_FREQUENCY'),
+                'positioning_system': first_array_value('POSITIONING_SYSTEM'),
             }
 
-            # ✅ Log extraction results
-            logger.info("=== FINAL META DATA EXTRACTION ===")
-            filled_fields = 0
-            for key, value in meta_data.items():
-                if value and str(value).strip() and str(value) not in ['', 'None', 'nan']:
-                    logger.info(f"✅ {key:30} = '{value}'")
-                    filled_fields += 1
-                else:
-                    logger.info(f"❌ {key:30} = (empty)")
-            
-            logger.info(f"=== EXTRACTED {filled_fields}/{len(meta_data)} FIELDS ===")
+            # ✅ Log extraction results - one guarded log call instead of
+            # 40+ per-field records (and zero string work above INFO)
+            if logger.isEnabledFor(logging.INFO):
+                filled = {
+                    key: bool(value and str(value).strip() and str(value) not in ['', 'None', 'nan'])
+                    for key, value in meta_data.items()
+                }
+                lines = [
+                    f"✅ {key:30} = '{meta_data[key]}'" if ok else f"❌ {key:30} = (empty)"
+                    for key, ok in filled.items()
+                ]
+                logger.info(
+                    "=== FINAL META DATA EXTRACTION ===\n%s\n=== EXTRACTED %d/%d FIELDS ===",
+                    "\n".join(lines), sum(filled.values()), len(meta_data)
+                )
 
             # Insert meta data FIRST
             self.insert_meta_data(meta_data)
@@ -1987,42 +2617,47 @@ class UltimateArgoNetCDFParser:
 
             # 2. PARAMETER_TABLE - Process parameters with proper indexing
             param_data_list = []
-            if 'PARAMETER' in ds.variables:
+            if 'PARAMETER' in var_names:
                 try:
-                    params = ds['PARAMETER'].values
+                    params = load_column('PARAMETER')
                     n_params = len(params)
-                    logger.info(f"Processing {n_params} parameters: {[self.safe_decode(p) for p in params]}")
-                    
+                    logger.info(f"Processing {n_params} parameters: {list(params)}")
+
+                    # Each companion column materialized once, not per row
+                    sensors_col = load_column('PARAMETER_SENSOR')
+                    units_col = load_column('PARAMETER_UNITS')
+                    accuracy_col = load_column('PARAMETER_ACCURACY')
+                    resolution_col = load_column('PARAMETER_RESOLUTION')
+                    equation_col = load_column('PREDEPLOYMENT_CALIB_EQUATION')
+                    coeff_col = load_column('PREDEPLOYMENT_CALIB_COEFFICIENT')
+                    comment_col = load_column('PREDEPLOYMENT_CALIB_COMMENT')
+
                     for param_idx in range(n_params):
-                        param_name = self.safe_decode(params[param_idx])
+                        param_name = column_at(params, param_idx)
                         if param_name and param_name.strip():
-                            
+
                             # Get coefficient value with special handling for JSON
-                            coeff_value = ''
-                            if 'PREDEPLOYMENT_CALIB_COEFFICIENT' in ds.variables:
-                                coeff_values = ds['PREDEPLOYMENT_CALIB_COEFFICIENT'].values
-                                if param_idx < len(coeff_values):
-                                    coeff_value = self.safe_decode(coeff_values[param_idx])
-                            
+                            coeff_value = column_at(coeff_col, param_idx)
+
                             # Handle coefficient for JSON field
                             if coeff_value and coeff_value.lower() not in ['n/a', 'none', '']:
                                 coefficient = coeff_value
                             else:
                                 coefficient = None  # Will be NULL in database
-                            
+
                             param_data = {
                                 'platform_number': platform_number,
                                 'parameter': param_name,
-                                'parameter_sensor': self.safe_decode(ds['PARAMETER_SENSOR'].values[param_idx] if 'PARAMETER_SENSOR' in ds and param_idx < len(ds['PARAMETER_SENSOR'].values) else ''),
-                                'parameter_units': self.safe_decode(ds['PARAMETER_UNITS'].values[param_idx] if 'PARAMETER_UNITS' in ds and param_idx < len(ds['PARAMETER_UNITS'].values) else ''),
-                                'parameter_accuracy': self.safe_decode(ds['PARAMETER_ACCURACY'].values[param_idx] if 'PARAMETER_ACCURACY' in ds and param_idx < len(ds['PARAMETER_ACCURACY'].values) else ''),
-                                'parameter_resolution': self.safe_decode(ds['PARAMETER_RESOLUTION'].values[param_idx] if 'PARAMETER_RESOLUTION' in ds and param_idx < len(ds['PARAMETER_RESOLUTION'].values) else ''),
-                                'predeployment_calib_equation': self.safe_decode(ds['PREDEPLOYMENT_CALIB_EQUATION'].values[param_idx] if 'PREDEPLOYMENT_CALIB_EQUATION' in ds and param_idx < len(ds['PREDEPLOYMENT_CALIB_EQUATION'].values) else ''),
+                                'parameter_sensor': column_at(sensors_col, param_idx),
+                                'parameter_units': column_at(units_col, param_idx),
+                                'parameter_accuracy': column_at(accuracy_col, param_idx),
+                                'parameter_resolution': column_at(resolution_col, param_idx),
+                                'predeployment_calib_equation': column_at(equation_col, param_idx),
                                 'coefficient': coefficient,
-                                'comment': self.safe_decode(ds['PREDEPLOYMENT_CALIB_COMMENT'].values[param_idx] if 'PREDEPLOYMENT_CALIB_COMMENT' in ds and param_idx < len(ds['PREDEPLOYMENT_CALIB_COMMENT'].values) else '')
+                                'comment': column_at(comment_col, param_idx)
                             }
                             param_data_list.append(param_data)
-                            logger.debug(f"Added parameter: {param_name} -> {param_data['parameter_sensor']}")
+                            logger.debug("Added parameter: %s -> %s", param_name, param_data['parameter_sensor'])
                             
                 except Exception as e:
                     logger.error(f"Error processing parameters: {e}")
@@ -2033,24 +2668,28 @@ class UltimateArgoNetCDFParser:
 
             # 3. SENSOR_TABLE - Process sensors
             sensor_data_list = []
-            if 'SENSOR' in ds.variables:
+            if 'SENSOR' in var_names:
                 try:
-                    sensors = ds['SENSOR'].values
+                    sensors = load_column('SENSOR')
                     n_sensors = len(sensors)
-                    logger.info(f"Processing {n_sensors} sensors: {[self.safe_decode(s) for s in sensors]}")
-                    
+                    logger.info(f"Processing {n_sensors} sensors: {list(sensors)}")
+
+                    maker_col = load_column('SENSOR_MAKER')
+                    model_col = load_column('SENSOR_MODEL')
+                    serial_col = load_column('SENSOR_SERIAL_NO')
+
                     for sensor_idx in range(n_sensors):
-                        sensor_name = self.safe_decode(sensors[sensor_idx])
+                        sensor_name = column_at(sensors, sensor_idx)
                         if sensor_name and sensor_name.strip():
                             sensor_data = {
                                 'platform_number': platform_number,
                                 'sensor': sensor_name,
-                                'sensor_maker': self.safe_decode(ds['SENSOR_MAKER'].values[sensor_idx] if 'SENSOR_MAKER' in ds and sensor_idx < len(ds['SENSOR_MAKER'].values) else ''),
-                                'sensor_model': self.safe_decode(ds['SENSOR_MODEL'].values[sensor_idx] if 'SENSOR_MODEL' in ds and sensor_idx < len(ds['SENSOR_MODEL'].values) else ''),
-                                'sensor_serial_no': self.safe_decode(ds['SENSOR_SERIAL_NO'].values[sensor_idx] if 'SENSOR_SERIAL_NO' in ds and sensor_idx < len(ds['SENSOR_SERIAL_NO'].values) else '')
+                                'sensor_maker': column_at(maker_col, sensor_idx),
+                                'sensor_model': column_at(model_col, sensor_idx),
+                                'sensor_serial_no': column_at(serial_col, sensor_idx)
                             }
                             sensor_data_list.append(sensor_data)
-                            logger.debug(f"Added sensor: {sensor_name} by {sensor_data['sensor_maker']}")
+                            logger.debug("Added sensor: %s by %s", sensor_name, sensor_data['sensor_maker'])
                             
                 except Exception as e:
                     logger.error(f"Error processing sensors: {e}")
@@ -2061,7 +2700,7 @@ class UltimateArgoNetCDFParser:
 
             # 4. LAUNCH_CONFIG_TABLE - Process launch configuration
             launch_config_data_list = []
-            if 'LAUNCH_CONFIG_PARAMETER_NAME' in ds.variables and 'LAUNCH_CONFIG_PARAMETER_VALUE' in ds.variables:
+            if 'LAUNCH_CONFIG_PARAMETER_NAME' in var_names and 'LAUNCH_CONFIG_PARAMETER_VALUE' in var_names:
                 try:
                     config_names = ds['LAUNCH_CONFIG_PARAMETER_NAME'].values
                     config_values = ds['LAUNCH_CONFIG_PARAMETER_VALUE'].values
@@ -2091,7 +2730,7 @@ class UltimateArgoNetCDFParser:
 
             # 5. CONFIG_TABLE - Process configuration parameters (handle 2D array)
             config_data_list = []
-            if 'CONFIG_PARAMETER_NAME' in ds.variables and 'CONFIG_PARAMETER_VALUE' in ds.variables:
+            if 'CONFIG_PARAMETER_NAME' in var_names and 'CONFIG_PARAMETER_VALUE' in var_names:
                 try:
                     config_names = ds['CONFIG_PARAMETER_NAME'].values
                     config_values = ds['CONFIG_PARAMETER_VALUE'].values
@@ -2110,25 +2749,23 @@ class UltimateArgoNetCDFParser:
                     n_config_values = len(config_values_1d)
                     logger.info(f"Processing {n_config_names} config names, {n_config_values} config values")
                     
+                    # Mission info is the same for every row - read it once
+                    mission_number = None
+                    mission_comment = ''
+
+                    mission_nums = load_column('CONFIG_MISSION_NUMBER')
+                    if mission_nums is not None and len(mission_nums) > 0:
+                        mission_number = self.safe_int(mission_nums[0])
+
+                    mission_comments = load_column('CONFIG_MISSION_COMMENT')
+                    if mission_comments is not None and len(mission_comments) > 0:
+                        mission_comment = self.safe_decode(mission_comments[0])
+
                     for config_idx in range(min(n_config_names, n_config_values)):
                         config_name = self.safe_decode(config_names[config_idx])
                         config_value = str(config_values_1d[config_idx])
                         
                         if config_name and config_name.strip():
-                            # Get mission info if available
-                            mission_number = None
-                            mission_comment = ''
-                            
-                            if 'CONFIG_MISSION_NUMBER' in ds.variables:
-                                mission_nums = ds['CONFIG_MISSION_NUMBER'].values
-                                if len(mission_nums) > 0:
-                                    mission_number = self.safe_int(mission_nums[0])
-                            
-                            if 'CONFIG_MISSION_COMMENT' in ds.variables:
-                                mission_comments = ds['CONFIG_MISSION_COMMENT'].values
-                                if len(mission_comments) > 0:
-                                    mission_comment = self.safe_decode(mission_comments[0])
-                            
                             config_data = {
                                 'platform_number': platform_number,
                                 'config_parameter_name': config_name,
@@ -2140,9 +2777,7 @@ class UltimateArgoNetCDFParser:
                             logger.debug(f"Added config: {config_name} = {config_value}")
                             
                 except Exception as e:
-                    logger.error(f"Error processing config parameters: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception(f"Error processing config parameters: {e}")
 
             if config_data_list:
                 self.insert_config_data(config_data_list)
@@ -2150,29 +2785,55 @@ class UltimateArgoNetCDFParser:
 
             # 6. HISTORY_TABLE - Process history (if any)
             history_data_list = []
-            if 'HISTORY_INSTITUTION' in ds.variables:
+            if 'HISTORY_INSTITUTION' in var_names:
                 try:
                     n_history = ds.sizes.get('N_HISTORY', 0)
                     logger.info(f"Processing {n_history} history entries")
-                    
+
+                    institution_col = load_column('HISTORY_INSTITUTION')
+                    step_col = load_column('HISTORY_STEP')
+                    software_col = load_column('HISTORY_SOFTWARE')
+                    release_col = load_column('HISTORY_SOFTWARE_RELEASE')
+                    reference_col = load_column('HISTORY_REFERENCE')
+                    date_col = load_column('HISTORY_DATE')
+                    action_col = load_column('HISTORY_ACTION')
+                    parameter_col = load_column('HISTORY_PARAMETER')
+                    start_pres_col = load_column('HISTORY_START_PRES')
+                    stop_pres_col = load_column('HISTORY_STOP_PRES')
+                    previous_col = load_column('HISTORY_PREVIOUS_VALUE')
+                    qctest_col = load_column('HISTORY_QCTEST')
+
+                    # Parse the whole date column once instead of a
+                    # strptime per history row
+                    dates_parsed = None
+                    if date_col is not None and date_col.dtype.kind == 'U':
+                        dates_parsed = self.bulk_argo_dates_to_datetime(date_col)
+
+                    def raw_at(col, idx, default=None):
+                        if col is not None and idx < len(col):
+                            return col[idx]
+                        return default
+
                     for hist_idx in range(n_history):
-                        history_institution = self.safe_decode(ds['HISTORY_INSTITUTION'].values[hist_idx] if 'HISTORY_INSTITUTION' in ds and hist_idx < len(ds['HISTORY_INSTITUTION'].values) else '')
+                        history_institution = column_at(institution_col, hist_idx)
                         if history_institution and history_institution.strip():
                             history_data = {
                                 'platform_number': platform_number,
                                 'cycle_number': None,
                                 'history_institution': history_institution,
-                                'history_step': self.safe_decode(ds['HISTORY_STEP'].values[hist_idx] if 'HISTORY_STEP' in ds and hist_idx < len(ds['HISTORY_STEP'].values) else ''),
-                                'history_software': self.safe_decode(ds['HISTORY_SOFTWARE'].values[hist_idx] if 'HISTORY_SOFTWARE' in ds and hist_idx < len(ds['HISTORY_SOFTWARE'].values) else ''),
-                                'history_software_release': self.safe_decode(ds['HISTORY_SOFTWARE_RELEASE'].values[hist_idx] if 'HISTORY_SOFTWARE_RELEASE' in ds and hist_idx < len(ds['HISTORY_SOFTWARE_RELEASE'].values) else ''),
-                                'history_reference': self.safe_decode(ds['HISTORY_REFERENCE'].values[hist_idx] if 'HISTORY_REFERENCE' in ds and hist_idx < len(ds['HISTORY_REFERENCE'].values) else ''),
-                                'history_date': self.argo_date_to_datetime(ds['HISTORY_DATE'].values[hist_idx] if 'HISTORY_DATE' in ds and hist_idx < len(ds['HISTORY_DATE'].values) else ''),
-                                'history_action': self.safe_decode(ds['HISTORY_ACTION'].values[hist_idx] if 'HISTORY_ACTION' in ds and hist_idx < len(ds['HISTORY_ACTION'].values) else ''),
-                                'history_parameter': self.safe_decode(ds['HISTORY_PARAMETER'].values[hist_idx] if 'HISTORY_PARAMETER' in ds and hist_idx < len(ds['HISTORY_PARAMETER'].values) else ''),
-                                'history_start_pres': self.safe_float(ds['HISTORY_START_PRES'].values[hist_idx] if 'HISTORY_START_PRES' in ds and hist_idx < len(ds['HISTORY_START_PRES'].values) else None),
-                                'history_stop_pres': self.safe_float(ds['HISTORY_STOP_PRES'].values[hist_idx] if 'HISTORY_STOP_PRES' in ds and hist_idx < len(ds['HISTORY_STOP_PRES'].values) else None),
-                                'history_previous_value': self.safe_decode(ds['HISTORY_PREVIOUS_VALUE'].values[hist_idx] if 'HISTORY_PREVIOUS_VALUE' in ds and hist_idx < len(ds['HISTORY_PREVIOUS_VALUE'].values) else ''),
-                                'history_qctest': self.safe_decode(ds['HISTORY_QCTEST'].values[hist_idx] if 'HISTORY_QCTEST' in ds and hist_idx < len(ds['HISTORY_QCTEST'].values) else '')
+                                'history_step': column_at(step_col, hist_idx),
+                                'history_software': column_at(software_col, hist_idx),
+                                'history_software_release': column_at(release_col, hist_idx),
+                                'history_reference': column_at(reference_col, hist_idx),
+                                'history_date': (dates_parsed[hist_idx]
+                                                 if dates_parsed is not None and hist_idx < len(dates_parsed)
+                                                 else self.argo_date_to_datetime(raw_at(date_col, hist_idx, ''))),
+                                'history_action': column_at(action_col, hist_idx),
+                                'history_parameter': column_at(parameter_col, hist_idx),
+                                'history_start_pres': self.safe_float(raw_at(start_pres_col, hist_idx)),
+                                'history_stop_pres': self.safe_float(raw_at(stop_pres_col, hist_idx)),
+                                'history_previous_value': column_at(previous_col, hist_idx),
+                                'history_qctest': column_at(qctest_col, hist_idx)
                             }
                             history_data_list.append(history_data)
                             
@@ -2195,9 +2856,7 @@ class UltimateArgoNetCDFParser:
             return True
 
         except Exception as e:
-            logger.error(f"Error processing meta file: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error processing meta file: {e}")
             return False
 
 
@@ -2276,7 +2935,7 @@ class UltimateArgoNetCDFParser:
                     return self.safe_decode(values[index])
             return default
         except Exception as e:
-            logger.debug(f"Error getting {var_name}[{index}]: {e}")
+            logger.debug("Error getting %s[%s]: %s", var_name, index, e)
             return default
 
 
@@ -2299,53 +2958,119 @@ class UltimateArgoNetCDFParser:
             else:
                 return default
         except Exception as e:
-            logger.warning(f"Error extracting {var_name}: {e}")
+            logger.warning("Error extracting %s: %s", var_name, e)
             return default
     
-    def insert_measurement_data(self, measurement_data_list):
-        """Insert measurement data with profile_id links and QC field validation"""
-        if not measurement_data_list:
+    # depth_measurements_table column order shared by both COPY paths
+    _MEASUREMENT_COLUMNS = (
+        'profile_id', 'platform_number', 'cycle_number', 'latitude', 'longitude',
+        'pres', 'temp', 'psal', 'pres_qc', 'temp_qc', 'psal_qc',
+        'pres_adjusted', 'temp_adjusted', 'psal_adjusted',
+        'pres_adjusted_qc', 'temp_adjusted_qc', 'psal_adjusted_qc',
+        'pres_adjusted_error', 'temp_adjusted_error', 'psal_adjusted_error',
+        'doxy', 'doxy_qc', 'doxy_adjusted', 'doxy_adjusted_qc', 'doxy_adjusted_error',
+        'nitrate', 'nitrate_qc', 'nitrate_adjusted', 'nitrate_adjusted_qc', 'nitrate_adjusted_error',
+        'ph_in_situ_total', 'ph_in_situ_total_qc', 'ph_in_situ_total_adjusted',
+        'ph_in_situ_total_adjusted_qc', 'ph_in_situ_total_adjusted_error',
+    )
+
+    def _copy_measurement_frame(self, frame):
+        """COPY a columnar measurement DataFrame into depth_measurements_table
+
+        to_csv serializes whole columns at C level, so no per-row dict or
+        tuple handling happens on the Python side. Rows without a
+        profile_id are dropped up front, mirroring the list path.
+        """
+        frame = frame[frame['profile_id'].notna()]
+        if frame.empty:
+            logger.warning("No valid measurements with profile_id to insert")
             return
 
         conn = self.connect_postgres()
         cursor = conn.cursor()
 
         try:
-            # Filter out measurements without profile_id and validate QC fields
-            valid_measurements = []
-            for measurement in measurement_data_list:
-                if not measurement.get('profile_id'):
-                    logger.warning(f"Skipping measurement without profile_id: {measurement.get('platform_number')}/{measurement.get('cycle_number')}")
-                    continue
-                valid_measurements.append(measurement)
+            import io
+
+            logger.info(f"Inserting {len(frame)} measurements with profile_id")
+
+            buf = io.StringIO()
+            frame.to_csv(buf, columns=list(self._MEASUREMENT_COLUMNS), header=False, index=False)
+            buf.seek(0)
+            cursor.copy_expert(
+                """
+                COPY depth_measurements_table (
+                    profile_id, platform_number, cycle_number, latitude, longitude,
+                    pres, temp, psal, pres_qc, temp_qc, psal_qc,
+                    pres_adjusted, temp_adjusted, psal_adjusted,
+                    pres_adjusted_qc, temp_adjusted_qc, psal_adjusted_qc,
+                    pres_adjusted_error, temp_adjusted_error, psal_adjusted_error,
+                    doxy, doxy_qc, doxy_adjusted, doxy_adjusted_qc, doxy_adjusted_error,
+                    nitrate, nitrate_qc, nitrate_adjusted, nitrate_adjusted_qc, nitrate_adjusted_error,
+                    ph_in_situ_total, ph_in_situ_total_qc, ph_in_situ_total_adjusted,
+                    ph_in_situ_total_adjusted_qc, ph_in_situ_total_adjusted_error
+                ) FROM STDIN WITH (FORMAT csv)
+                """,
+                buf
+            )
+            self._commit(conn)
 
-            if not valid_measurements:
-                logger.warning("No valid measurements with profile_id to insert")
-                return
+            logger.info(f"✅ Successfully inserted {len(frame)} measurements with profile_id links")
 
-            logger.info(f"Inserting {len(valid_measurements)} measurements with profile_id")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"❌ Error inserting measurement data: {e}")
+            raise
+        finally:
+            cursor.close()
 
-            # Helper function to validate QC fields (CHAR(1))
-            def safe_qc_field(value, default='0'):
-                """Ensure QC field is exactly 1 character"""
-                if value is None:
-                    return default
-                str_val = str(value).strip()
-                if len(str_val) == 0:
-                    return default
-                # Take only the first character
-                return str_val[0]
+    def insert_measurement_data(self, measurement_data_list):
+        """Insert measurement data with profile_id links and QC field validation"""
+        if measurement_data_list is None or len(measurement_data_list) == 0:
+            return
 
-            # Batch insert measurements
-            batch_size = 1000
-            total_inserted = 0
-            
-            for i in range(0, len(valid_measurements), batch_size):
-                batch = valid_measurements[i:i + batch_size]
-                batch_values = []
-                
-                for measurement in batch:
-                    batch_values.append((
+        # Columnar path: process_profile_file hands over a DataFrame
+        if isinstance(measurement_data_list, pd.DataFrame):
+            self._copy_measurement_frame(measurement_data_list)
+            return
+
+        # Filter out measurements without profile_id and validate QC fields
+        valid_measurements = []
+        for measurement in measurement_data_list:
+            if not measurement.get('profile_id'):
+                logger.warning("Skipping measurement without profile_id: %s/%s", measurement.get('platform_number'), measurement.get('cycle_number'))
+                continue
+            valid_measurements.append(measurement)
+
+        if not valid_measurements:
+            logger.warning("No valid measurements with profile_id to insert")
+            return
+
+        logger.info(f"Inserting {len(valid_measurements)} measurements with profile_id")
+
+        # Helper function to validate QC fields (CHAR(1))
+        def safe_qc_field(value, default='0'):
+            """Ensure QC field is exactly 1 character"""
+            if value is None:
+                return default
+            str_val = str(value).strip()
+            if len(str_val) == 0:
+                return default
+            # Take only the first character
+            return str_val[0]
+
+        # Stream rows through COPY FROM STDIN - one protocol exchange
+        # instead of parametrized INSERT batches. The table has no
+        # conflict target, so no staging table is needed.
+        import csv
+        import io
+
+        def build_csv(rows):
+            """Serialize measurement rows to an in-memory CSV for COPY"""
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            for measurement in rows:
+                writer.writerow((
                         measurement['profile_id'],
                         measurement['platform_number'],
                         measurement['cycle_number'],
@@ -2386,40 +3111,65 @@ class UltimateArgoNetCDFParser:
                         safe_qc_field(measurement.get('ph_in_situ_total_adjusted_qc', '0')),
                         measurement.get('ph_in_situ_total_adjusted_error')
                     ))
+            buf.seek(0)
+            return buf
+
+        copy_sql = """
+            COPY depth_measurements_table (
+                profile_id, platform_number, cycle_number, latitude, longitude,
+                pres, temp, psal, pres_qc, temp_qc, psal_qc,
+                pres_adjusted, temp_adjusted, psal_adjusted,
+                pres_adjusted_qc, temp_adjusted_qc, psal_adjusted_qc,
+                pres_adjusted_error, temp_adjusted_error, psal_adjusted_error,
+                doxy, doxy_qc, doxy_adjusted, doxy_adjusted_qc, doxy_adjusted_error,
+                nitrate, nitrate_qc, nitrate_adjusted, nitrate_adjusted_qc, nitrate_adjusted_error,
+                ph_in_situ_total, ph_in_situ_total_qc, ph_in_situ_total_adjusted,
+                ph_in_situ_total_adjusted_qc, ph_in_situ_total_adjusted_error
+            ) FROM STDIN WITH (FORMAT csv)
+        """
+
+        def copy_chunk(rows):
+            """COPY one chunk on its own pooled connection and commit"""
+            with self.pooled_connection() as chunk_conn:
+                chunk_cursor = chunk_conn.cursor()
+                try:
+                    chunk_cursor.copy_expert(copy_sql, build_csv(rows))
+                    chunk_conn.commit()
+                except Exception:
+                    chunk_conn.rollback()
+                    raise
+                finally:
+                    chunk_cursor.close()
 
-                # Use execute_values for efficient batch insert
-                from psycopg2.extras import execute_values
-                
-                execute_values(
-                    cursor,
-                    """
-                    INSERT INTO depth_measurements_table (
-                        profile_id, platform_number, cycle_number, latitude, longitude,
-                        pres, temp, psal, pres_qc, temp_qc, psal_qc,
-                        pres_adjusted, temp_adjusted, psal_adjusted,
-                        pres_adjusted_qc, temp_adjusted_qc, psal_adjusted_qc,
-                        pres_adjusted_error, temp_adjusted_error, psal_adjusted_error,
-                        doxy, doxy_qc, doxy_adjusted, doxy_adjusted_qc, doxy_adjusted_error,
-                        nitrate, nitrate_qc, nitrate_adjusted, nitrate_adjusted_qc, nitrate_adjusted_error,
-                        ph_in_situ_total, ph_in_situ_total_qc, ph_in_situ_total_adjusted,
-                        ph_in_situ_total_adjusted_qc, ph_in_situ_total_adjusted_error
-                    ) VALUES %s
-                    """,
-                    batch_values,
-                    template=None,
-                    page_size=100
-                )
-                
-                conn.commit()
-                total_inserted += len(batch)
-                logger.info(f"Batch {i//batch_size + 1}: Inserted {len(batch)} measurements")
+        try:
+            chunks = [
+                valid_measurements[i:i + MEASUREMENT_COPY_CHUNK]
+                for i in range(0, len(valid_measurements), MEASUREMENT_COPY_CHUNK)
+            ]
+            if len(chunks) > 1 and not self._in_transaction:
+                # Several chunks: load them concurrently on separate pooled
+                # connections. Inside transaction() the shared connection
+                # owns the commit, so fall through to the serial path.
+                workers = min(MEASUREMENT_COPY_WORKERS, len(chunks))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(copy_chunk, chunks))
+            else:
+                conn = self.connect_postgres()
+                cursor = conn.cursor()
+                try:
+                    cursor.copy_expert(copy_sql, build_csv(valid_measurements))
+                    self._commit(conn)
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
 
-            logger.info(f"✅ Successfully inserted {total_inserted} measurements with profile_id links")
+            logger.info(f"✅ Successfully inserted {len(valid_measurements)} measurements with profile_id links")
 
         except Exception as e:
-            conn.rollback()
             logger.error(f"❌ Error inserting measurement data: {e}")
-            
+
             # Debug: Show a sample measurement to see what's causing the issue
             if measurement_data_list:
                 sample = measurement_data_list[0]
@@ -2428,8 +3178,6 @@ class UltimateArgoNetCDFParser:
                     if 'qc' in key.lower():
                         logger.error(f"  {key}: {repr(value)} (type: {type(value)}, len: {len(str(value)) if value else 0})")
             raise
-        finally:
-            cursor.close()
 
 
 
@@ -2460,34 +3208,152 @@ class UltimateArgoNetCDFParser:
             n_history = ds.sizes.get('N_HISTORY', 0)
             logger.info(f"Number of measurements: {n_measurement}, cycles: {n_cycle}, history: {n_history}")
 
-            # Helper function for cycle-level data
+            # Cycle-level variables are read once for the whole file; the
+            # helper then just indexes the preloaded arrays per cycle
+            preloaded_cycle = self.preload_cycle_vars(ds, (
+                'CYCLE_NUMBER_INDEX', 'CYCLE_NUMBER_INDEX_ADJUSTED',
+                'JULD_FIRST_LOCATION', 'JULD_LAST_LOCATION',
+                'JULD_FIRST_MESSAGE', 'JULD_LAST_MESSAGE',
+                'JULD_ASCENT_START', 'JULD_ASCENT_END',
+                'JULD_DESCENT_START', 'JULD_DESCENT_END',
+                'JULD_PARK_START', 'JULD_PARK_END',
+                'JULD_TRANSMISSION_START', 'JULD_TRANSMISSION_END',
+                'DATA_MODE', 'CONFIG_MISSION_NUMBER', 'GROUNDED',
+                'REPRESENTATIVE_PARK_PRESSURE',
+                'REPRESENTATIVE_PARK_PRESSURE_STATUS',
+                'JULD_FIRST_LOCATION_STATUS', 'JULD_LAST_LOCATION_STATUS',
+                'JULD_FIRST_MESSAGE_STATUS', 'JULD_LAST_MESSAGE_STATUS',
+            ))
+
             def safe_get_cycle_var(var_name, cycle_idx, default=None):
-                """Safely extract cycle-level variable"""
-                if var_name not in ds:
-                    return default
-                
-                try:
-                    var_values = ds[var_name].values
-                    if var_values.ndim == 0:
-                        return self.enhanced_julian_to_datetime(var_values.item()) if 'JULD' in var_name else self.safe_decode(var_values.item())
-                    elif cycle_idx < len(var_values):
-                        if 'JULD' in var_name:
-                            return self.enhanced_julian_to_datetime(var_values[cycle_idx])
-                        else:
-                            return self.safe_decode(var_values[cycle_idx])
+                """Safely extract cycle-level variable from the preloaded arrays"""
+                return self.safe_get_cycle_var_prealloc(preloaded_cycle, var_name, cycle_idx, default)
+
+            # Measurement-level variables are likewise materialized once up
+            # front; calling ds[var].values inside the depth loop re-reads
+            # the whole array per row, which is quadratic in n_measurement
+            meas_arrays = {
+                name: ds[name].values
+                for name in (
+                    'CYCLE_NUMBER', 'MEASUREMENT_CODE', 'LATITUDE', 'LONGITUDE',
+                    'JULD', 'JULD_STATUS', 'JULD_ADJUSTED', 'JULD_ADJUSTED_QC',
+                    'JULD_ADJUSTED_STATUS', 'POSITION_QC', 'POSITION_ACCURACY',
+                    'AXES_ERROR_ELLIPSE_MAJOR', 'AXES_ERROR_ELLIPSE_MINOR',
+                    'AXES_ERROR_ELLIPSE_ANGLE', 'SATELLITE_NAME',
+                    'POSITIONING_SYSTEM', 'PRES', 'PRES_QC', 'PRES_ADJUSTED',
+                    'PRES_ADJUSTED_QC', 'PRES_ADJUSTED_ERROR', 'TEMP', 'TEMP_QC',
+                    'TEMP_ADJUSTED', 'TEMP_ADJUSTED_QC', 'TEMP_ADJUSTED_ERROR',
+                    'PSAL', 'PSAL_QC', 'PSAL_ADJUSTED', 'PSAL_ADJUSTED_QC',
+                    'PSAL_ADJUSTED_ERROR',
+                )
+                if name in ds.variables
+            }
+
+            # Numeric measurement columns are cleaned once as whole arrays
+            # (Struct-of-Arrays): one _bulk_safe_float pass per variable
+            # replaces a safe_float call per cell in the depth loop
+            meas_float_cols = {}
+            for name in (
+                'CYCLE_NUMBER', 'MEASUREMENT_CODE', 'LATITUDE', 'LONGITUDE',
+                'AXES_ERROR_ELLIPSE_MAJOR', 'AXES_ERROR_ELLIPSE_MINOR',
+                'AXES_ERROR_ELLIPSE_ANGLE', 'PRES', 'PRES_ADJUSTED',
+                'PRES_ADJUSTED_ERROR', 'TEMP', 'TEMP_ADJUSTED',
+                'TEMP_ADJUSTED_ERROR', 'PSAL', 'PSAL_ADJUSTED',
+                'PSAL_ADJUSTED_ERROR',
+            ):
+                arr = meas_arrays.get(name)
+                if arr is not None and arr.ndim == 1:
+                    cleaned = self._bulk_safe_float(arr)
+                    if cleaned is not None:
+                        meas_float_cols[name] = cleaned
+
+            def meas_float(var_name, meas_idx):
+                """Cleaned float for one measurement cell, preferring the bulk column"""
+                col = meas_float_cols.get(var_name)
+                if col is not None and meas_idx < len(col):
+                    return col[meas_idx]
+                return self.safe_float(safe_get_measurement_var(var_name, meas_idx))
+
+            # Helper function for safe CHAR(1) truncation
+            def safe_qc_char(value, default='0'):
+                if value is None:
                     return default
-                except Exception as e:
-                    logger.warning(f"Error extracting {var_name}[{cycle_idx}]: {e}")
+                str_val = str(value).strip()
+                if str_val.lower() in ['nan', 'nat', '']:
                     return default
+                return str_val[:1]
+
+            def bulk_qc_char(arr, default):
+                """Vectorized safe_qc_char over a whole QC flag column"""
+                decoded = self._decode_col(arr)
+                if decoded is None:
+                    return None
+                first = decoded.astype('U1')
+                lowered = np.char.lower(decoded)
+                return np.where(
+                    (first == '') | (lowered == 'nan') | (lowered == 'nat'),
+                    default, first
+                ).tolist()
+
+            # QC flag columns decode once per variable instead of once per
+            # row. The scalar path fed byte-typed flags through safe_float
+            # (which cannot parse bytes) before safe_qc_char ever saw them,
+            # collapsing every flag to its default; the bulk decode reads
+            # the actual flag characters
+            meas_qc_cols = {}
+            for name, qc_default in (
+                ('JULD_STATUS', '9'), ('JULD_ADJUSTED_QC', '0'),
+                ('JULD_ADJUSTED_STATUS', '9'), ('POSITION_QC', '0'),
+                ('POSITION_ACCURACY', '0'), ('PRES_QC', '0'),
+                ('PRES_ADJUSTED_QC', '0'), ('TEMP_QC', '0'),
+                ('TEMP_ADJUSTED_QC', '0'), ('PSAL_QC', '0'),
+                ('PSAL_ADJUSTED_QC', '0'),
+            ):
+                arr = meas_arrays.get(name)
+                if arr is not None and arr.ndim == 1:
+                    col = bulk_qc_char(arr, qc_default)
+                    if col is not None:
+                        meas_qc_cols[name] = col
+
+            def meas_qc(var_name, meas_idx, default='0'):
+                """Cleaned QC flag for one cell, preferring the bulk column"""
+                col = meas_qc_cols.get(var_name)
+                if col is not None and meas_idx < len(col):
+                    return col[meas_idx]
+                return safe_qc_char(safe_get_measurement_var(var_name, meas_idx), default)
+
+            # JULD columns convert in one pd.to_datetime pass each instead
+            # of an enhanced_julian_to_datetime + clean_timestamp_value
+            # call pair per row
+            meas_juld_cols = {}
+            for name in ('JULD', 'JULD_ADJUSTED'):
+                arr = meas_arrays.get(name)
+                if arr is not None and arr.ndim == 1 and arr.dtype.kind in 'fiM':
+                    meas_juld_cols[name] = self.bulk_julian_to_datetime(arr)
+
+            def meas_juld(var_name, meas_idx):
+                """Converted timestamp for one cell, preferring the bulk column"""
+                col = meas_juld_cols.get(var_name)
+                if col is not None and meas_idx < len(col):
+                    return col[meas_idx]
+                return self.clean_timestamp_value(safe_get_measurement_var(var_name, meas_idx))
+
+            def meas_int(var_name, meas_idx):
+                """Cleaned int for one measurement cell, preferring the bulk column"""
+                col = meas_float_cols.get(var_name)
+                if col is not None and meas_idx < len(col):
+                    val = col[meas_idx]
+                    return None if val is None else int(val)
+                return self.safe_int(safe_get_measurement_var(var_name, meas_idx))
 
             # Helper function for measurement-level data
             def safe_get_measurement_var(var_name, meas_idx, default=None):
-                """Safely extract measurement-level variable"""
-                if var_name not in ds:
+                """Safely extract measurement-level variable from the preloaded arrays"""
+                var_values = meas_arrays.get(var_name)
+                if var_values is None:
                     return default
-                
+
                 try:
-                    var_values = ds[var_name].values
                     if var_values.ndim == 0:
                         if 'JULD' in var_name:
                             return self.enhanced_julian_to_datetime(var_values.item())
@@ -2504,17 +3370,30 @@ class UltimateArgoNetCDFParser:
                             return self.safe_float(var_values[meas_idx])
                     return default
                 except Exception as e:
-                    logger.warning(f"Error extracting {var_name}[{meas_idx}]: {e}")
+                    logger.warning("Error extracting %s[%s]: %s", var_name, meas_idx, e)
                     return default
 
+            # History-level variables get the same once-per-file
+            # materialization as the cycle and measurement variables
+            hist_arrays = {
+                name: ds[name].values
+                for name in (
+                    'HISTORY_INSTITUTION', 'HISTORY_STEP', 'HISTORY_SOFTWARE',
+                    'HISTORY_SOFTWARE_RELEASE', 'HISTORY_REFERENCE',
+                    'HISTORY_DATE', 'HISTORY_ACTION', 'HISTORY_PARAMETER',
+                    'HISTORY_QCTEST',
+                )
+                if name in ds.variables
+            }
+
             # Helper function for history-level data
             def safe_get_history_var(var_name, hist_idx, default=None):
-                """Safely extract history-level variable"""
-                if var_name not in ds:
+                """Safely extract history-level variable from the preloaded arrays"""
+                var_values = hist_arrays.get(var_name)
+                if var_values is None:
                     return default
-                
+
                 try:
-                    var_values = ds[var_name].values
                     if var_values.ndim == 0:
                         if 'HISTORY_DATE' in var_name:
                             return self.enhanced_julian_to_datetime(var_values.item())
@@ -2527,7 +3406,6 @@ class UltimateArgoNetCDFParser:
                                 try:
                                     # Parse YYYYMMDDHHMMSS format
                                     if len(date_str) >= 14:
-                                        from datetime import datetime
                                         return datetime.strptime(date_str[:14], '%Y%m%d%H%M%S')
                                     return None
                                 except:
@@ -2537,7 +3415,7 @@ class UltimateArgoNetCDFParser:
                             return self.safe_decode(var_values[hist_idx])
                     return default
                 except Exception as e:
-                    logger.warning(f"Error extracting {var_name}[{hist_idx}]: {e}")
+                    logger.warning("Error extracting %s[%s]: %s", var_name, hist_idx, e)
                     return default
 
             # 1. TRAJECTORY_TABLE - Create cycle-level summary data
@@ -2591,17 +3469,40 @@ class UltimateArgoNetCDFParser:
 
             logger.info(f"Created {len(trajectory_data_list)} trajectory cycle records")
 
-            # Insert trajectory data first
+            # Insert trajectory data first; the merge's RETURNING clause
+            # hands back the cycle -> trajectory_id mapping, so the depth
+            # block below needs no follow-up SELECT
+            trajectory_ids = {}
             if trajectory_data_list:
-                self.insert_trajectory_data(trajectory_data_list)
+                trajectory_ids = self.insert_trajectory_data(trajectory_data_list)
 
             # 2. HISTORY_TABLE - Extract history data from trajectory file
             history_data_list = []
             
             if n_history > 0:
                 logger.info(f"Processing {n_history} history records from trajectory file")
-                
-                for hist_idx in range(n_history):
+
+                # Most trajectory files carry largely empty history rows;
+                # decode the four selector columns once and only visit
+                # indices where at least one is non-empty
+                selector_cols = []
+                for name in ('HISTORY_INSTITUTION', 'HISTORY_STEP',
+                             'HISTORY_SOFTWARE', 'HISTORY_ACTION'):
+                    decoded = self._decode_col(hist_arrays.get(name))
+                    if decoded is not None and decoded.ndim == 1 and len(decoded) == n_history:
+                        selector_cols.append(decoded)
+
+                if selector_cols:
+                    valid_mask = np.zeros(n_history, dtype=bool)
+                    for selector in selector_cols:
+                        valid_mask |= selector != ''
+                    hist_indices = np.flatnonzero(valid_mask)
+                else:
+                    # Multi-dimensional or oddly typed history columns keep
+                    # the full scan with the per-row any() check below
+                    hist_indices = range(n_history)
+
+                for hist_idx in hist_indices:
                     # Extract history data
                     history_institution = safe_get_history_var('HISTORY_INSTITUTION', hist_idx, '')
                     history_step = safe_get_history_var('HISTORY_STEP', hist_idx, '')
@@ -2643,68 +3544,50 @@ class UltimateArgoNetCDFParser:
                 self.insert_history_data(history_data_list)
 
             # 3. TRAJECTORY_DEPTH_TABLE - Create measurement-level data
-            # 3. TRAJECTORY_DEPTH_TABLE - Create measurement-level data with DEBUG
-            trajectory_depth_list = []
 
-            conn = self.connect_postgres()
-            cursor = conn.cursor()
-            try:
-                # Get trajectory IDs for this platform
-                cursor.execute("""
-                    SELECT trajectory_id, cycle_number 
-                    FROM trajectory_table 
-                    WHERE platform_number = %s 
-                    ORDER BY cycle_number
-                """, (platform_number,))
-                trajectory_records = cursor.fetchall()
-                
-                # Create lookup dictionary
-                trajectory_ids = {cycle: traj_id for traj_id, cycle in trajectory_records}
-                logger.info(f"🔍 Found {len(trajectory_ids)} trajectory IDs for platform {platform_number}")
+            # cycle -> trajectory_id mapping came back from the merge
+            logger.info(f"🔍 Found {len(trajectory_ids)} trajectory IDs for platform {platform_number}")
 
-                # 🔍 DEBUG: Check what cycles we have
-                logger.info(f"🔍 Available cycles: {list(trajectory_ids.keys())[:10]}...")  # Show first 10
+            # 🔍 DEBUG: Check what cycles we have
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 Available cycles: %s...", list(trajectory_ids.keys())[:10])  # Show first 10
 
-                # Process ALL measurements with detailed debugging
-                skipped_reasons = {"no_trajectory_id": 0, "no_useful_data": 0, "created": 0}
-                
+            # Process ALL measurements with detailed debugging
+            skipped_reasons = {"no_trajectory_id": 0, "no_useful_data": 0, "created": 0}
+            
+            # Depth rows stream straight into the insert as a generator;
+            # the full list of ~30-key row dicts never materializes next
+            # to the preloaded numpy columns
+            def depth_rows():
                 for meas_idx in range(n_measurement):
-                    cycle_number = self.safe_int(safe_get_measurement_var('CYCLE_NUMBER', meas_idx))
-                    measurement_code = self.safe_int(safe_get_measurement_var('MEASUREMENT_CODE', meas_idx))
-                    
+                    cycle_number = meas_int('CYCLE_NUMBER', meas_idx)
+                    measurement_code = meas_int('MEASUREMENT_CODE', meas_idx)
+                
                     # Find matching trajectory_id
                     trajectory_id = trajectory_ids.get(cycle_number)
-                    
+                
                     # 🔍 DEBUG: Log first few measurements
                     if meas_idx < 5:
-                        logger.info(f"🔍 Measurement {meas_idx}: cycle={cycle_number}, code={measurement_code}, traj_id={trajectory_id}")
-                    
+                        logger.debug("🔍 Measurement %s: cycle=%s, code=%s, traj_id=%s",
+                                     meas_idx, cycle_number, measurement_code, trajectory_id)
+                
                     if trajectory_id is not None:
                         # Get position data
-                        lat_val = safe_get_measurement_var('LATITUDE', meas_idx)
-                        lon_val = safe_get_measurement_var('LONGITUDE', meas_idx)
-                        raw_juld = safe_get_measurement_var('JULD', meas_idx)
-                        cleaned_juld = self.clean_timestamp_value(raw_juld)
-                        
+                        lat_val = meas_float('LATITUDE', meas_idx)
+                        lon_val = meas_float('LONGITUDE', meas_idx)
+                        cleaned_juld = meas_juld('JULD', meas_idx)
+                    
                         # 🔍 DEBUG: Log data availability for first few
                         if meas_idx < 5:
-                            logger.info(f"🔍   Data: lat={lat_val}, lon={lon_val}, juld={cleaned_juld}, code={measurement_code}")
-                        
+                            logger.debug("🔍   Data: lat=%s, lon=%s, juld=%s, code=%s",
+                                         lat_val, lon_val, cleaned_juld, measurement_code)
+                    
                         # Check if we have ANY useful data
                         has_position = lat_val is not None or lon_val is not None
                         has_time = cleaned_juld is not None
                         has_measurement_code = measurement_code is not None
-                        
+                    
                         if has_position or has_time or has_measurement_code:
-                            # Helper function for safe CHAR(1) truncation
-                            def safe_qc_char(value, default='0'):
-                                if value is None:
-                                    return default
-                                str_val = str(value).strip()
-                                if str_val.lower() in ['nan', 'nat', '']:
-                                    return default
-                                return str_val[:1]
-                            
                             traj_depth_data = {
                                 'trajectory_id': trajectory_id,
                                 'platform_number': platform_number,
@@ -2714,61 +3597,57 @@ class UltimateArgoNetCDFParser:
                                 'latitude': lat_val,
                                 'longitude': lon_val,
                                 'juld': cleaned_juld,
-                                'juld_status': safe_qc_char(safe_get_measurement_var('JULD_STATUS', meas_idx), '9'),
-                                'juld_adjusted': self.clean_timestamp_value(safe_get_measurement_var('JULD_ADJUSTED', meas_idx)),
-                                'juld_adjusted_qc': safe_qc_char(safe_get_measurement_var('JULD_ADJUSTED_QC', meas_idx), '0'),
-                                'juld_adjusted_status': safe_qc_char(safe_get_measurement_var('JULD_ADJUSTED_STATUS', meas_idx), '9'),
-                                'position_qc': safe_qc_char(safe_get_measurement_var('POSITION_QC', meas_idx), '0'),
-                                'position_accuracy': safe_qc_char(safe_get_measurement_var('POSITION_ACCURACY', meas_idx)),
-                                'axes_error_ellipse_major': self.safe_float(safe_get_measurement_var('AXES_ERROR_ELLIPSE_MAJOR', meas_idx)),
-                                'axes_error_ellipse_minor': self.safe_float(safe_get_measurement_var('AXES_ERROR_ELLIPSE_MINOR', meas_idx)),
-                                'axes_error_ellipse_angle': self.safe_float(safe_get_measurement_var('AXES_ERROR_ELLIPSE_ANGLE', meas_idx)),
+                                'juld_status': meas_qc('JULD_STATUS', meas_idx, '9'),
+                                'juld_adjusted': meas_juld('JULD_ADJUSTED', meas_idx),
+                                'juld_adjusted_qc': meas_qc('JULD_ADJUSTED_QC', meas_idx, '0'),
+                                'juld_adjusted_status': meas_qc('JULD_ADJUSTED_STATUS', meas_idx, '9'),
+                                'position_qc': meas_qc('POSITION_QC', meas_idx, '0'),
+                                'position_accuracy': meas_qc('POSITION_ACCURACY', meas_idx),
+                                'axes_error_ellipse_major': meas_float('AXES_ERROR_ELLIPSE_MAJOR', meas_idx),
+                                'axes_error_ellipse_minor': meas_float('AXES_ERROR_ELLIPSE_MINOR', meas_idx),
+                                'axes_error_ellipse_angle': meas_float('AXES_ERROR_ELLIPSE_ANGLE', meas_idx),
                                 'satellite_name': str(safe_get_measurement_var('SATELLITE_NAME', meas_idx, ''))[:10],
                                 'positioning_system': str(safe_get_measurement_var('POSITIONING_SYSTEM', meas_idx, ''))[:50],
-                                'pres': self.safe_float(safe_get_measurement_var('PRES', meas_idx)),
-                                'pres_qc': safe_qc_char(safe_get_measurement_var('PRES_QC', meas_idx), '0'),
-                                'pres_adjusted': self.safe_float(safe_get_measurement_var('PRES_ADJUSTED', meas_idx)),
-                                'pres_adjusted_qc': safe_qc_char(safe_get_measurement_var('PRES_ADJUSTED_QC', meas_idx), '0'),
-                                'pres_adjusted_error': self.safe_float(safe_get_measurement_var('PRES_ADJUSTED_ERROR', meas_idx)),
-                                'temp': self.safe_float(safe_get_measurement_var('TEMP', meas_idx)),
-                                'temp_qc': safe_qc_char(safe_get_measurement_var('TEMP_QC', meas_idx), '0'),
-                                'temp_adjusted': self.safe_float(safe_get_measurement_var('TEMP_ADJUSTED', meas_idx)),
-                                'temp_adjusted_qc': safe_qc_char(safe_get_measurement_var('TEMP_ADJUSTED_QC', meas_idx), '0'),
-                                'temp_adjusted_error': self.safe_float(safe_get_measurement_var('TEMP_ADJUSTED_ERROR', meas_idx)),
-                                'psal': self.safe_float(safe_get_measurement_var('PSAL', meas_idx)),
-                                'psal_qc': safe_qc_char(safe_get_measurement_var('PSAL_QC', meas_idx), '0'),
-                                'psal_adjusted': self.safe_float(safe_get_measurement_var('PSAL_ADJUSTED', meas_idx)),
-                                'psal_adjusted_qc': safe_qc_char(safe_get_measurement_var('PSAL_ADJUSTED_QC', meas_idx), '0'),
-                                'psal_adjusted_error': self.safe_float(safe_get_measurement_var('PSAL_ADJUSTED_ERROR', meas_idx))
+                                'pres': meas_float('PRES', meas_idx),
+                                'pres_qc': meas_qc('PRES_QC', meas_idx, '0'),
+                                'pres_adjusted': meas_float('PRES_ADJUSTED', meas_idx),
+                                'pres_adjusted_qc': meas_qc('PRES_ADJUSTED_QC', meas_idx, '0'),
+                                'pres_adjusted_error': meas_float('PRES_ADJUSTED_ERROR', meas_idx),
+                                'temp': meas_float('TEMP', meas_idx),
+                                'temp_qc': meas_qc('TEMP_QC', meas_idx, '0'),
+                                'temp_adjusted': meas_float('TEMP_ADJUSTED', meas_idx),
+                                'temp_adjusted_qc': meas_qc('TEMP_ADJUSTED_QC', meas_idx, '0'),
+                                'temp_adjusted_error': meas_float('TEMP_ADJUSTED_ERROR', meas_idx),
+                                'psal': meas_float('PSAL', meas_idx),
+                                'psal_qc': meas_qc('PSAL_QC', meas_idx, '0'),
+                                'psal_adjusted': meas_float('PSAL_ADJUSTED', meas_idx),
+                                'psal_adjusted_qc': meas_qc('PSAL_ADJUSTED_QC', meas_idx, '0'),
+                                'psal_adjusted_error': meas_float('PSAL_ADJUSTED_ERROR', meas_idx)
                             }
-                            
-                            trajectory_depth_list.append(traj_depth_data)
+                        
+                            yield traj_depth_data
                             skipped_reasons["created"] += 1
                         else:
                             skipped_reasons["no_useful_data"] += 1
                     else:
                         skipped_reasons["no_trajectory_id"] += 1
 
-                # 🔍 DEBUG: Show why records were skipped
-                logger.info(f"🔍 TRAJECTORY DEPTH SUMMARY:")
-                logger.info(f"  - Created: {skipped_reasons['created']}")
-                logger.info(f"  - No trajectory_id: {skipped_reasons['no_trajectory_id']}")
-                logger.info(f"  - No useful data: {skipped_reasons['no_useful_data']}")
-                
-                if trajectory_depth_list:
-                    logger.info(f"✅ Inserting {len(trajectory_depth_list)} trajectory depth records")
-                    self.insert_trajectory_depth_data(trajectory_depth_list)
-                else:
-                    logger.error("❌ NO trajectory depth records created - debugging needed!")
+            # The insert consumes the generator; the skipped_reasons
+            # counters are complete once it returns
+            self.insert_trajectory_depth_data(depth_rows())
+
+            # 🔍 DEBUG: Show why records were skipped
+            logger.info(f"🔍 TRAJECTORY DEPTH SUMMARY:")
+            logger.info(f"  - Created: {skipped_reasons['created']}")
+            logger.info(f"  - No trajectory_id: {skipped_reasons['no_trajectory_id']}")
+            logger.info(f"  - No useful data: {skipped_reasons['no_useful_data']}")
+
+            if not skipped_reasons["created"]:
+                logger.error("❌ NO trajectory depth records created - debugging needed!")
 
-            finally:
-                cursor.close()
-                conn.close()
 
         except Exception as e:
-            logger.error(f"Error processing trajectory file: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error processing trajectory file: {e}")
             return False
         finally:
             if ds is not None:
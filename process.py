@@ -5,21 +5,18 @@ Receives any Argo file and automatically parses and inserts data
 """
 
 from parser import UltimateArgoNetCDFParser
+import fnmatch
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-def process_argo_file(file_path, verify=True, verbose=True):
+def _process_with_parser(parser, file_path, verify=True, verbose=True):
     """
-    Process any Argo NetCDF file - automatically detects type and processes
+    Process one Argo NetCDF file with an already-built parser
 
-    Args:
-        file_path (str): Path to the NetCDF file
-        verify (bool): Whether to verify data insertion after processing
-        verbose (bool): Whether to print detailed progress information
-
-    Returns:
-        dict: Processing results with success status and details
+    Reusing the parser across files keeps its pooled DB connection and
+    session state (prepared statements, schema checks) alive instead of
+    rebuilding them per file.
     """
     try:
         # Validate file exists
@@ -30,12 +27,6 @@ def process_argo_file(file_path, verify=True, verbose=True):
                 "file_path": file_path
             }
 
-        # Initialize parser
-        if verbose:
-            print(f"🔄 Initializing parser...")
-
-        parser = UltimateArgoNetCDFParser()
-
         # Process the file
         if verbose:
             print(f"📂 Processing file: {os.path.basename(file_path)}")
@@ -74,7 +65,47 @@ def process_argo_file(file_path, verify=True, verbose=True):
             "file_name": os.path.basename(file_path) if os.path.exists(file_path) else "Unknown"
         }
 
-def process_multiple_files(file_paths, verify=True, verbose=True):
+def process_argo_file(file_path, verify=True, verbose=True):
+    """
+    Process any Argo NetCDF file - automatically detects type and processes
+
+    Args:
+        file_path (str): Path to the NetCDF file
+        verify (bool): Whether to verify data insertion after processing
+        verbose (bool): Whether to print detailed progress information
+
+    Returns:
+        dict: Processing results with success status and details
+    """
+    # Initialize parser
+    if verbose:
+        print(f"🔄 Initializing parser...")
+
+    parser = UltimateArgoNetCDFParser()
+    return _process_with_parser(parser, file_path, verify=verify, verbose=verbose)
+
+# One parser per worker process, built lazily on the first file
+_worker_parser = None
+
+def _process_file_worker(args):
+    """
+    Worker for parallel file processing
+
+    Runs in its own process, so it builds its own parser (DB connections
+    are not fork-safe and must not be shared across workers) and reuses
+    it for every file the worker handles. The parser instance is
+    stripped from the result because it cannot be pickled back to the
+    parent process.
+    """
+    global _worker_parser
+    file_path, verify, verbose = args
+    if _worker_parser is None:
+        _worker_parser = UltimateArgoNetCDFParser()
+    result = _process_with_parser(_worker_parser, file_path, verify=verify, verbose=verbose)
+    result.pop("parser", None)
+    return result
+
+def process_multiple_files(file_paths, verify=True, verbose=True, max_workers=None):
     """
     Process multiple Argo NetCDF files
 
@@ -82,6 +113,9 @@ def process_multiple_files(file_paths, verify=True, verbose=True):
         file_paths (list): List of file paths to process
         verify (bool): Whether to verify data insertion
         verbose (bool): Whether to print progress
+        max_workers (int): Number of worker processes (default: half the
+            CPUs). Files are independent, so NetCDF decoding in one worker
+            overlaps database inserts in another.
 
     Returns:
         dict: Results for all files processed
@@ -93,24 +127,36 @@ def process_multiple_files(file_paths, verify=True, verbose=True):
         "results": []
     }
 
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = min(max_workers, len(file_paths)) or 1
+
     if verbose:
-        print(f"🚀 Processing {len(file_paths)} files...")
+        print(f"🚀 Processing {len(file_paths)} files with {max_workers} worker(s)...")
 
-    for i, file_path in enumerate(file_paths, 1):
-        if verbose:
-            print(f"\n📁 [{i}/{len(file_paths)}] Processing: {os.path.basename(file_path)}")
+    if max_workers == 1:
+        # One parser (and one DB session) serves the whole batch
+        parser = UltimateArgoNetCDFParser()
+        file_results = [
+            _process_with_parser(parser, file_path, verify=verify, verbose=verbose)
+            for file_path in file_paths
+        ]
+    else:
+        worker_args = [(file_path, verify, verbose) for file_path in file_paths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            file_results = list(executor.map(_process_file_worker, worker_args))
 
-        result = process_argo_file(file_path, verify=verify, verbose=verbose)
+    for i, result in enumerate(file_results, 1):
         results["results"].append(result)
 
         if result["success"]:
             results["successful"] += 1
             if verbose:
-                print(f"✅ [{i}/{len(file_paths)}] Success: {os.path.basename(file_path)}")
+                print(f"✅ [{i}/{len(file_paths)}] Success: {os.path.basename(file_paths[i - 1])}")
         else:
             results["failed"] += 1
             if verbose:
-                print(f"❌ [{i}/{len(file_paths)}] Failed: {os.path.basename(file_path)}")
+                print(f"❌ [{i}/{len(file_paths)}] Failed: {os.path.basename(file_paths[i - 1])}")
                 print(f"   Error: {result['error']}")
 
     if verbose:
@@ -136,15 +182,20 @@ def process_directory(directory_path, pattern="*.nc", verify=True, verbose=True)
     """
     try:
         # Find all matching files
-        directory = Path(directory_path)
-        if not directory.exists():
+        if not os.path.isdir(directory_path):
             return {
                 "success": False,
                 "error": f"Directory not found: {directory_path}"
             }
 
-        files = list(directory.glob(pattern))
-        file_paths = [str(f) for f in files]
+        # One scandir pass filters on the dirent name without the extra
+        # stat and Path allocation per entry that glob() pays
+        with os.scandir(directory_path) as entries:
+            file_paths = sorted(
+                entry.path for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and fnmatch.fnmatch(entry.name, pattern)
+            )
 
         if not file_paths:
             return {
@@ -157,41 +157,41 @@ CREATE TABLE depth_measurements_table (
     latitude DECIMAL(10, 6),
     longitude DECIMAL(11, 6),
 
-    pres DECIMAL(10, 3),
+    pres DOUBLE PRECISION,
     pres_qc CHAR(1),
-    pres_adjusted DECIMAL(10, 3),
+    pres_adjusted DOUBLE PRECISION,
     pres_adjusted_qc CHAR(1),
-    pres_adjusted_error DECIMAL(10, 3),
+    pres_adjusted_error DOUBLE PRECISION,
 
-    temp DECIMAL(8, 4),
+    temp DOUBLE PRECISION,
     temp_qc CHAR(1),
-    temp_adjusted DECIMAL(8, 4),
+    temp_adjusted DOUBLE PRECISION,
     temp_adjusted_qc CHAR(1),
-    temp_adjusted_error DECIMAL(8, 4),
+    temp_adjusted_error DOUBLE PRECISION,
 
-    psal DECIMAL(8, 4),
+    psal DOUBLE PRECISION,
     psal_qc CHAR(1),
-    psal_adjusted DECIMAL(8, 4),
+    psal_adjusted DOUBLE PRECISION,
     psal_adjusted_qc CHAR(1),
-    psal_adjusted_error DECIMAL(8, 4),
+    psal_adjusted_error DOUBLE PRECISION,
 
-    doxy DECIMAL(8, 4),
+    doxy DOUBLE PRECISION,
     doxy_qc CHAR(1),
-    doxy_adjusted DECIMAL(8, 4),
+    doxy_adjusted DOUBLE PRECISION,
     doxy_adjusted_qc CHAR(1),
-    doxy_adjusted_error DECIMAL(8, 4),
+    doxy_adjusted_error DOUBLE PRECISION,
 
-    nitrate DECIMAL(8, 4),
+    nitrate DOUBLE PRECISION,
     nitrate_qc CHAR(1),
-    nitrate_adjusted DECIMAL(8, 4),
+    nitrate_adjusted DOUBLE PRECISION,
     nitrate_adjusted_qc CHAR(1),
-    nitrate_adjusted_error DECIMAL(8, 4),
+    nitrate_adjusted_error DOUBLE PRECISION,
 
-    ph_in_situ_total DECIMAL(8, 4),
+    ph_in_situ_total DOUBLE PRECISION,
     ph_in_situ_total_qc CHAR(1),
-    ph_in_situ_total_adjusted DECIMAL(8, 4),
+    ph_in_situ_total_adjusted DOUBLE PRECISION,
     ph_in_situ_total_adjusted_qc CHAR(1),
-    ph_in_situ_total_adjusted_error DECIMAL(8, 4),
+    ph_in_situ_total_adjusted_error DOUBLE PRECISION,
 
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -209,8 +209,8 @@ CREATE TABLE history_table (
     history_date TIMESTAMP,
     history_action VARCHAR(100),
     history_parameter VARCHAR(100),
-    history_start_pres DECIMAL(10, 3),
-    history_stop_pres DECIMAL(10, 3),
+    history_start_pres DOUBLE PRECISION,
+    history_stop_pres DOUBLE PRECISION,
     history_previous_value TEXT,
     history_qctest VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -300,7 +300,7 @@ CREATE TABLE trajectory_table (
     
     config_mission_number INTEGER,
     grounded CHAR(1),
-    representative_park_pressure DECIMAL(10, 3),
+    representative_park_pressure DOUBLE PRECISION,
     representative_park_pressure_status CHAR(1),
     cycle_number_adjusted INTEGER,
     
@@ -317,33 +317,33 @@ CREATE TABLE trajectory_depth_table (
     longitude DECIMAL(11, 6),
     juld TIMESTAMP,
     
-    pres DECIMAL(10, 3),
+    pres DOUBLE PRECISION,
     pres_qc CHAR(1),
-    pres_adjusted DECIMAL(10, 3),
+    pres_adjusted DOUBLE PRECISION,
     pres_adjusted_qc CHAR(1),
-    pres_adjusted_error DECIMAL(10, 3),
+    pres_adjusted_error DOUBLE PRECISION,
     
-    temp DECIMAL(8, 4),
+    temp DOUBLE PRECISION,
     temp_qc CHAR(1),
-    temp_adjusted DECIMAL(8, 4),
+    temp_adjusted DOUBLE PRECISION,
     temp_adjusted_qc CHAR(1),
-    temp_adjusted_error DECIMAL(8, 4),
+    temp_adjusted_error DOUBLE PRECISION,
     
-    psal DECIMAL(8, 4),
+    psal DOUBLE PRECISION,
     psal_qc CHAR(1),
-    psal_adjusted DECIMAL(8, 4),
+    psal_adjusted DOUBLE PRECISION,
     psal_adjusted_qc CHAR(1),
-    psal_adjusted_error DECIMAL(8, 4),
+    psal_adjusted_error DOUBLE PRECISION,
     
-    doxy DECIMAL(8, 4),
+    doxy DOUBLE PRECISION,
     doxy_qc CHAR(1),
-    chla DECIMAL(8, 4),
+    chla DOUBLE PRECISION,
     chla_qc CHAR(1),
-    bbp700 DECIMAL(8, 4),
+    bbp700 DOUBLE PRECISION,
     bbp700_qc CHAR(1),
-    nitrate DECIMAL(8, 4),
+    nitrate DOUBLE PRECISION,
     nitrate_qc CHAR(1),
-    ph_in_situ_total DECIMAL(8, 4),
+    ph_in_situ_total DOUBLE PRECISION,
     ph_in_situ_total_qc CHAR(1),
     
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -357,9 +357,9 @@ CREATE TABLE trajectory_depth_table (
     juld_adjusted_status CHAR(1),
     
     position_accuracy CHAR(1),
-    axes_error_ellipse_major DECIMAL(8, 2),
-    axes_error_ellipse_minor DECIMAL(8, 2),
-    axes_error_ellipse_angle DECIMAL(6, 2),
+    axes_error_ellipse_major DOUBLE PRECISION,
+    axes_error_ellipse_minor DOUBLE PRECISION,
+    axes_error_ellipse_angle DOUBLE PRECISION,
     satellite_name VARCHAR(10),
     positioning_system VARCHAR(50),
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,